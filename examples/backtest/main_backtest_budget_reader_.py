@@ -23,8 +23,9 @@ from pathlib import Path
 
 warnings.filterwarnings("ignore")
 
-# Adicionar src ao path
+# Adicionar a raiz do projeto (pacote examples) e src ao path
 base_dir = Path(__file__).parents[2]
+sys.path.insert(0, str(base_dir))
 sys.path.insert(0, str(Path(base_dir, "src")))
 
 
@@ -14,15 +14,11 @@ __maintainer__ = "Emerson V. Rafael"
 __email__ = "emersonssmile@gmail.com"
 __status__ = "Development"
 
-import sys
 from functools import lru_cache
 from pathlib import Path
 
 from dynaconf import Dynaconf
 
-# Adjust import path for data functions
-sys.path.insert(0, str(Path(__file__).parents[2]))
-
 # Get current directory
 CONFIG_PATH = Path(__file__).parent.resolve()
 
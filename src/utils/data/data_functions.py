@@ -57,6 +57,7 @@ __squad__ = "DataCraft"
 __email__ = "emersonssmile@gmail.com"
 __status__ = "Development"
 
+import importlib.util
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -74,6 +75,10 @@ sys.path.insert(0, str(Path(base_dir, "src")))
 from config.config_logger import logger
 from utils.python_functions import to_float_resilient
 
+# Engine padrão para leitura de Excel: calamine (em Rust, muito mais rápido que o openpyxl),
+# quando instalado; caso contrário, o engine padrão do pandas
+DEFAULT_EXCEL_READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
 
 def read_data(
     file_path: Union[str, Path],
@@ -81,6 +86,7 @@ def read_data(
     header: Optional[Union[int, List[int]]] = 0,
     default_sheet: Optional[Union[str, List[str]]] = ["Sheet1", "Planilha1", "Plan1"],
     engine: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
 ) -> pd.DataFrame:
     """
     Lê dados de vários formatos de arquivo usando a extensão do arquivo para determinar o método apropriado.
@@ -91,7 +97,11 @@ def read_data(
         sheet_name (Optional[Union[str, int]]): Nome ou índice da aba a ser lida (para arquivos Excel). Padrão é None.
         header (Optional[Union[int, List[int]]]): Número(s) da(s) linha(s) a ser(em) usada(s) como nomes das colunas. Padrão é 0.
         default_sheet (Optional[Union[str, List[str]]]): Nome ou lista de nomes das abas padrão a serem lidas se a aba especificada não for encontrada.
-        engine (Optional[str]): Motor a ser usado para leitura de arquivos Excel. Padrão é None.
+        engine (Optional[str]): Motor a ser usado para leitura de arquivos Excel. Padrão é None, que usa
+            DEFAULT_EXCEL_READ_ENGINE (calamine, se instalado) quando engine_kwargs não é informado;
+            se essa leitura falhar, o arquivo é lido novamente com o engine padrão do pandas.
+        engine_kwargs (Optional[dict]): Argumentos repassados ao motor de leitura do Excel
+            (e.g., {"read_only": True, "data_only": True} para openpyxl). Padrão é None.
 
     Returns:
         pd.DataFrame: DataFrame contendo os dados lidos.
@@ -108,15 +118,22 @@ def read_data(
     # Obtendo a extensão do dado recebido
     extension = file_path.suffix.lower()
 
+    # Argumentos de engine (e.g., openpyxl) informados sem engine mantêm o engine padrão do pandas
+    use_default_engine = engine is None and engine_kwargs is None
+    if use_default_engine:
+        engine = DEFAULT_EXCEL_READ_ENGINE
+
     # Definindo os leitores disponíveis no data functions
     readers = {
         ".csv": lambda path: pd.read_csv(path, header=header),
         ".xlsx": lambda path: pd.read_excel(
-            path, sheet_name=sheet_name, header=header, engine=engine
+            path, sheet_name=sheet_name, header=header, engine=engine, engine_kwargs=engine_kwargs
+        ),
+        ".xls": lambda path: pd.read_excel(
+            path, sheet_name=sheet_name, header=header, engine=engine, engine_kwargs=engine_kwargs
         ),
-        ".xls": lambda path: pd.read_excel(path, sheet_name=sheet_name, header=header),
         ".xlsm": lambda path: pd.read_excel(
-            path, sheet_name=sheet_name, header=header
+            path, sheet_name=sheet_name, header=header, engine=engine, engine_kwargs=engine_kwargs
         ),  # Added support for .xlsm files
         ".json": lambda path: pd.read_json(path),
         ".parquet": lambda path: pd.read_parquet(path),
@@ -129,26 +146,57 @@ def read_data(
         raise ValueError(f"Unsupported file extension: {extension}")
 
     try:
-        # Tenta carregar a aba especificada
-        return reader(file_path)
+        try:
+            # Tenta carregar a aba especificada
+            return reader(file_path)
+        except Exception as e:
+            # Falha do engine padrão (calamine) que não seja aba inexistente:
+            # tenta novamente com o engine padrão do pandas (openpyxl)
+            if (
+                not use_default_engine
+                or engine is None
+                or extension not in (".xlsx", ".xls", ".xlsm")
+                or "Worksheet named" in str(e)
+            ):
+                raise
+            logger.warning(
+                f"Falha ao ler o arquivo {file_path} com o engine '{engine}': {e}. "
+                "Tentando novamente com o engine padrão."
+            )
+            engine = None
+            return reader(file_path)
     except ValueError as e:
         # Tratamento específico para erro de aba não encontrada
         if "Worksheet named" in str(e) and "not found" in str(e):
             try:
                 # Listar todas as abas disponíveis no arquivo
-                available_sheets = pd.ExcelFile(file_path).sheet_names
+                available_sheets = pd.ExcelFile(
+                    file_path, engine=engine, engine_kwargs=engine_kwargs
+                ).sheet_names
                 if isinstance(default_sheet, str) and default_sheet in available_sheets:
                     logger.warning(
                         f"Aba '{sheet_name}' não encontrada. Carregando a aba padrão '{default_sheet}'."
                     )
-                    return pd.read_excel(file_path, sheet_name=default_sheet, header=header)
+                    return pd.read_excel(
+                        file_path,
+                        sheet_name=default_sheet,
+                        header=header,
+                        engine=engine,
+                        engine_kwargs=engine_kwargs,
+                    )
                 elif isinstance(default_sheet, list):
                     for sheet in default_sheet:
                         if sheet in available_sheets:
                             logger.warning(
                                 f"Aba '{sheet_name}' não encontrada. Carregando a aba padrão '{sheet}'."
                             )
-                            return pd.read_excel(file_path, sheet_name=sheet, header=header)
+                            return pd.read_excel(
+                                file_path,
+                                sheet_name=sheet,
+                                header=header,
+                                engine=engine,
+                                engine_kwargs=engine_kwargs,
+                            )
                 raise ValueError(
                     f"Aba '{sheet_name}' não encontrada no arquivo '{file_path}'. "
                     f"As abas disponíveis são: {available_sheets}"
@@ -168,6 +216,8 @@ def export_data(
     file_path: Union[str, Path],
     create_dirs: bool = True,
     index: bool = False,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
     **kwargs,
 ) -> None:
     """
@@ -178,6 +228,8 @@ def export_data(
         file_path (Union[str, Path]): Caminho onde o arquivo será salvo.
         create_dirs (bool): Se True, cria diretórios automaticamente se não existirem. Default é True.
         index (bool): Se True, inclui o índice ao salvar os dados. Default é False.
+        engine (Optional[str]): Engine de escrita do Excel (e.g., "openpyxl", "xlsxwriter"). Default é openpyxl.
+        engine_kwargs (Optional[dict]): Argumentos adicionais repassados ao engine de escrita do Excel.
         **kwargs: Argumentos adicionais passados para a função de exportação do pandas.
 
     Raises:
@@ -194,9 +246,13 @@ def export_data(
     exporters = {
         ".csv": lambda df, path: df.to_csv(path, index=index, **kwargs),
         ".xlsx": lambda df, path: (
-            df.to_excel(path, index=index, **kwargs)
+            df.to_excel(path, index=index, engine=engine, engine_kwargs=engine_kwargs, **kwargs)
             if isinstance(df, pd.DataFrame)
-            else (_export_multiple_sheets(df, path, index=index, **kwargs))
+            else (
+                _export_multiple_sheets(
+                    df, path, index=index, engine=engine, engine_kwargs=engine_kwargs, **kwargs
+                )
+            )
         ),
         ".json": lambda df, path: df.to_json(path, **kwargs),
         ".parquet": lambda df, path: df.to_parquet(path, **kwargs),
@@ -215,7 +271,12 @@ def export_data(
 
 
 def _export_multiple_sheets(
-    data: Dict[str, pd.DataFrame], path: Union[str, Path], index: bool = False, **kwargs
+    data: Dict[str, pd.DataFrame],
+    path: Union[str, Path],
+    index: bool = False,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
+    **kwargs,
 ):
     """
     Função auxiliar para exportar múltiplas abas para um arquivo Excel.
@@ -224,9 +285,11 @@ def _export_multiple_sheets(
         data (Dict[str, pd.DataFrame]): Dicionário de DataFrames para exportação.
         path (Union[str, Path]): Caminho para o arquivo Excel.
         index (bool): Se True, inclui o índice ao salvar os dados. Default é False.
+        engine (Optional[str]): Engine de escrita do Excel. Default é openpyxl.
+        engine_kwargs (Optional[dict]): Argumentos adicionais repassados ao engine de escrita.
         **kwargs: Argumentos adicionais para pandas.to_excel.
     """
-    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+    with pd.ExcelWriter(path, engine=engine or "openpyxl", engine_kwargs=engine_kwargs) as writer:
         for sheet_name, sheet_data in data.items():
             sheet_data.to_excel(writer, sheet_name=sheet_name, index=index, **kwargs)
 
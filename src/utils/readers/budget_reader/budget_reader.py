@@ -66,23 +66,56 @@ __squad__ = "DataCraft"
 __email__ = "emersonssmile@gmail.com"
 __status__ = "Development"
 
-import math
-import sys
+# API pública do módulo
+__all__ = [
+    "FileInput",
+    "normalize_header_columns",
+    "preprocess_data",
+    "find_pattern_positions",
+    "scan_sheet",
+    "locate_table",
+    "find_metadata_value",
+    "extract_metadata",
+    "rename_and_select_columns",
+    "extract_table",
+    "normalize_filter_values",
+    "convert_result_dtypes",
+    "compile_filter",
+    "compile_filters",
+    "apply_filter",
+    "post_process_table",
+    "read_raw_sheets",
+    "read_data_budget",
+    "read_budget_table",
+    "save_results",
+    "concat_tables",
+    "append_and_save_results",
+    "append_and_save_results_json",
+    "append_data",
+    "get_files_from_directory",
+    "process_file",
+    "orchestrate_budget_reader",
+]
+
+import importlib.util
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from pydantic.dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
 
-# Adicionar src ao path
+# Diretório raiz do projeto (base dos caminhos de saída)
 base_dir = Path(__file__).parents[4]
-sys.path.insert(0, str(Path(base_dir, "src")))
 
 from config.config_logger import logger
 from config.config_dynaconf import get_settings
 from utils.readers.budget_reader.config_metadata import get_metadata_keys
 from utils.data.data_functions import (
-    read_data,
     transform_case,
     export_data,
     rename_columns,
@@ -124,12 +157,92 @@ DICT_RENAME = {
     "default03": settings.get("default_budget_reader.default03.result", {}),
 }
 
+
+# Função para normalizar (uppercase) os nomes de colunas de um padrão de cabeçalho
+def normalize_header_columns(columns: list) -> tuple:
+    """
+    Normaliza os nomes de colunas de um padrão de cabeçalho para uppercase.
+
+    Args:
+        columns (list): Lista de nomes de colunas.
+
+    Returns:
+        tuple: Nomes de colunas normalizados (valores não textuais são mantidos).
+    """
+    return tuple(str(col).upper() if isinstance(col, str) else col for col in columns)
+
+
+# Colunas esperadas e alternativas já normalizadas, calculadas uma única vez
+NORMALIZED_EXPECTED_COLUMNS = {
+    key: normalize_header_columns(columns) for key, columns in EXPECTED_COLUMNS.items()
+}
+NORMALIZED_ALTERNATIVE_COLUMNS = {
+    key: frozenset(normalize_header_columns(columns))
+    for key, columns in ALTERNATIVE_COLUMNS.items()
+}
+
 # Obtendo as chaves de metadados padrão
 DEFAULT_METADATA_KEYS = get_metadata_keys()
 
+# Abas consultadas pelos metadados (lidas junto com a aba da tabela)
+METADATA_SHEET_NAMES = list(
+    dict.fromkeys(
+        config["sheet_name"]
+        for pattern_keys in DEFAULT_METADATA_KEYS.values()
+        for config in pattern_keys.values()
+        if config.get("sheet_name")
+    )
+)
+
+# Número de linhas iniciais em que o cabeçalho é buscado antes de varrer a planilha inteira
+MAX_HEADER_SCAN_ROWS = 200
+
+# Padrões de metadados (uppercase) de cada padrão de planilha, pré-compilados na carga do módulo
+METADATA_PATTERNS_BY_KEY = {
+    pattern_key: tuple(
+        dict.fromkeys(
+            config["pattern"].upper() for config in pattern_keys.values() if config.get("pattern")
+        )
+    )
+    for pattern_key, pattern_keys in DEFAULT_METADATA_KEYS.items()
+}
+
+# Padrões de metadados (uppercase) localizados durante a varredura da planilha
+METADATA_PATTERNS = list(
+    dict.fromkeys(pattern for patterns in METADATA_PATTERNS_BY_KEY.values() for pattern in patterns)
+)
+
+# Tipo de string baseado em Arrow, usado nas comparações de texto dos filtros
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+# Módulos necessários para cada engine de leitura do Excel
+EXCEL_ENGINE_MODULES = {
+    "calamine": "python_calamine",
+    "openpyxl": "openpyxl",
+    "xlrd": "xlrd",
+    "pyxlsb": "pyxlsb",
+    "odf": "odf",
+}
+
+# Engine de leitura do Excel (python-calamine por padrão; openpyxl é usado como fallback)
+EXCEL_ENGINE = settings.get("default_budget_reader.excel_engine", "calamine") or None
+if (
+    EXCEL_ENGINE
+    and importlib.util.find_spec(EXCEL_ENGINE_MODULES.get(EXCEL_ENGINE, EXCEL_ENGINE)) is None
+):
+    EXCEL_ENGINE = None
+
+# Leitura do Excel apenas com valores (sem estilos e fórmulas)
+EXCEL_OPENPYXL_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
+
 # Definindo a coluna desejado no resultado
 SELECTED_COLUMNS = settings.get("default_budget_reader.result.list_result_columns", [])
 
+# Colunas do resultado convertidas para tipos numéricos e string (pyarrow)
+NUMERIC_RESULT_COLUMNS = settings.get("default_budget_reader.result.numeric_columns", [])
+STRING_RESULT_COLUMNS = settings.get("default_budget_reader.result.string_columns", [])
+DOWNCAST_NUMERIC_COLUMNS = settings.get("default_budget_reader.result.downcast_numeric", False)
+
 # Filtros no pós processamento
 FILTROS = settings.get(
     "default_budget_reader.filtros.dict_filtros", {}
@@ -138,165 +251,340 @@ FILTROS = settings.get(
 # Diretório de saída padrão
 DIR_OUTPUTS = settings.get("default_budget_reader.dir_outputs.path", "outputs")
 
+# Colunas de origem (arquivo e aba) adicionadas às tabelas processadas
+SOURCE_FILE_COLUMN_NAME = settings.get(
+    "default_budget_reader.SOURCE_FILE_COLUMN_NAME", "SOURCE_FILE"
+)
+SHEET_NAME_COLUMN_NAME = settings.get("default_budget_reader.SHEET_NAME_COLUMN_NAME", "SHEET_NAME")
+
+# Número máximo de processos usados para ler os arquivos (vazio ou 0 usa o número de CPUs)
+MAX_WORKERS = settings.get("default_budget_reader.max_workers", None)
+
+# Nomes das abas e do arquivo de saída
+NAME_SHEET_OUTPUT_TABLES = settings.get(
+    "default_budget_reader.result.name_sheet_output_tables", "Tables"
+)
+NAME_SHEET_OUTPUT_METADATA = settings.get(
+    "default_budget_reader.result.name_sheet_output_metadata", "Metadata"
+)
+FILE_NAME_OUTPUT = settings.get(
+    "default_budget_reader.result.file_name_output", "budget_reader_output.xlsx"
+)
+
+# Engine de escrita do Excel (xlsxwriter é mais rápido; openpyxl é usado se não estiver instalado)
+EXCEL_WRITER_ENGINE = settings.get("default_budget_reader.result.excel_writer_engine", "xlsxwriter")
+if EXCEL_WRITER_ENGINE and importlib.util.find_spec(EXCEL_WRITER_ENGINE) is None:
+    EXCEL_WRITER_ENGINE = "openpyxl"
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileInput:
     """
     Representa um arquivo de entrada com caminho e nome da aba opcional.
 
     Attributes:
         file_path (str): Caminho do arquivo.
-        sheet_name (Optional[str]): Nome da aba a ser lida (padrão: "LPU").
+        sheet_name (Optional[str]): Nome da aba a ser lida (padrão: None, testa SHEET_NAMES_TRY).
     """
 
     file_path: str  # Caminho completo do arquivo
     sheet_name: Optional[str] = None  # Nome da aba (padrão: None para todas as abas)
 
 
-# Função para normalizar uma lista de valores, removendo espaços, convertendo para letras minúsculas e tratando valores NaN
-def normalize_values(values: list) -> list:
+# Função para pré-processar o DataFrame, removendo linhas completamente em branco e resetando o índice
+def preprocess_data(df: pd.DataFrame, drop_empty_rows: bool = True) -> pd.DataFrame:
     """
-    Normaliza uma lista de valores, removendo espaços, convertendo para letras minúsculas
-    e substituindo valores NaN ou vazios por strings vazias.
+    Realiza o pré-processamento inicial dos dados, incluindo a remoção de linhas totalmente em branco.
 
     Args:
-        values (list): Lista de valores a serem normalizados.
+        df (pd.DataFrame): DataFrame bruto lido da planilha.
+        drop_empty_rows (bool): Remove as linhas totalmente em branco (e reseta o índice).
+            Quando False, as linhas são mantidas nas posições originais da planilha.
 
     Returns:
-        list: Lista de valores normalizados.
+        pd.DataFrame: DataFrame pré-processado.
     """
-    return [
-        (
-            ""
-            if pd.isna(val) or (isinstance(val, float) and math.isnan(val))
-            else str(val).strip().lower()
-        )
-        for val in values  # Remove espaços, converte para minúsculas e trata NaN
+    # Remove linhas vazias e reseta o índice
+    if drop_empty_rows:
+        df = df.dropna(how="all").reset_index(drop=True)
+
+    # Converte todas as colunas em uppercase e sem acentos
+    df = transform_case(df=df, columns_to_upper=True, columns_to_remove_accents=True)
+
+    # Apenas colunas com texto precisam de uppercase/remoção de acentos nas células
+    text_columns = [
+        col
+        for col in df.columns
+        if pd.api.types.infer_dtype(df[col], skipna=True) in ("string", "mixed", "mixed-integer")
     ]
 
+    # Converte as celulas de texto em uppercase e sem acentos
+    return transform_case(
+        df=df,
+        cells_to_upper=text_columns,
+        cells_to_remove_accents=text_columns,
+    )
 
-# Função para pré-processar o DataFrame, removendo linhas completamente em branco e resetando o índice
-def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
+
+# Função para localizar, de forma vetorizada, as células que contêm cada padrão de texto
+def find_pattern_positions(
+    values: np.ndarray, patterns: Sequence[str], empty_mask: Optional[np.ndarray] = None
+) -> Dict[str, List[Tuple[int, int]]]:
     """
-    Realiza o pré-processamento inicial dos dados, incluindo a remoção de linhas totalmente em branco.
+    Localiza as células (não vazias) cujo texto normalizado (strip + uppercase) contém cada padrão.
+
+    Os textos das células preenchidas são convertidos uma única vez. Uma expressão regular
+    com todos os padrões seleciona as células candidatas em uma única passada e, em seguida,
+    cada padrão é buscado com np.char.find apenas nessas células.
 
     Args:
-        df (pd.DataFrame): DataFrame bruto lido da planilha.
+        values (np.ndarray): Valores da aba (DataFrame.to_numpy).
+        patterns (Sequence[str]): Padrões (uppercase) a serem localizados.
+        empty_mask (Optional[np.ndarray]): Máscara de células vazias (pd.isna(values)), se já calculada.
 
     Returns:
-        pd.DataFrame: DataFrame pré-processado.
+        dict: Dicionário que mapeia cada padrão às posições (linha, coluna) que o contêm,
+              na ordem linha a linha, coluna a coluna.
     """
-    # Remove linhas vazias e reseta o índice
-    df = df.dropna(how="all").reset_index(drop=True)
+    pattern_hits = {pattern: [] for pattern in patterns}
+    if not patterns:
+        return pattern_hits
 
-    # Converte todas as colunas e celulas em uppercase
-    return transform_case(
-        df=df,
-        columns_to_upper=True,
-        cells_to_upper=True,
-        columns_to_remove_accents=True,
-        cells_to_remove_accents=True,
-    )
+    if empty_mask is None:
+        empty_mask = pd.isna(values)
 
+    # Posições das células preenchidas (ordem linha a linha, coluna a coluna)
+    positions = np.argwhere(~empty_mask)
+    if not len(positions):
+        return pattern_hits
 
-# Função para localizar dinamicamente o cabeçalho da tabela no DataFrame
-def locate_table(
+    # Normaliza o texto das células preenchidas uma única vez
+    cells = [str(value).strip().upper() for value in values[positions[:, 0], positions[:, 1]]]
+
+    # Pré-filtro: uma única expressão regular com todos os padrões seleciona as células candidatas
+    patterns_regex = re.compile("|".join(map(re.escape, patterns)))
+    candidates = [idx for idx, cell in enumerate(cells) if patterns_regex.search(cell)]
+    if not candidates:
+        return pattern_hits
+
+    positions = positions[candidates]
+    cells = np.array([cells[idx] for idx in candidates], dtype=str)
+
+    # Cada padrão é buscado apenas nas células candidatas
+    for pattern in patterns:
+        matches = positions[np.char.find(cells, pattern) >= 0]
+        pattern_hits[pattern] = [(int(row), int(col)) for row, col in matches.tolist()]
+
+    return pattern_hits
+
+
+# Função para varrer a planilha uma única vez, localizando o cabeçalho e os padrões de metadados
+def scan_sheet(
     df: pd.DataFrame,
     expected_columns: dict = EXPECTED_COLUMNS,
     alternative_columns: dict = ALTERNATIVE_COLUMNS,
-) -> Tuple[Optional[int], Optional[int], Optional[list]]:
+    metadata_patterns: List[str] = METADATA_PATTERNS,
+    values: Optional[np.ndarray] = None,
+    empty_mask: Optional[np.ndarray] = None,
+) -> Tuple[
+    Optional[int], Optional[int], Optional[str], Optional[list], Dict[str, List[Tuple[int, int]]]
+]:
     """
-    Detecta a posição (linha, coluna) onde o cabeçalho da tabela começa, testando múltiplos padrões de colunas.
+    Varre a planilha uma única vez e, na mesma passada, detecta a posição do cabeçalho
+    da tabela e as células que contêm cada padrão de metadados.
+
+    O cabeçalho é buscado de forma vetorizada (sliding_window_view) para cada padrão, primeiro
+    nas MAX_HEADER_SCAN_ROWS linhas iniciais e só então no restante da planilha. A conversão
+    para NumPy e a máscara de células vazias são compartilhadas com a busca de metadados.
+    O cabeçalho é a primeira linha que corresponde a algum dos padrões; dentro da mesma linha,
+    vale a ordem de prioridade de expected_columns.
 
     Args:
         df (pd.DataFrame): DataFrame contendo os dados da planilha.
         expected_columns (dict): Dicionário com listas de colunas esperadas para diferentes padrões.
         alternative_columns (dict): Dicionário com listas alternativas mínimas de colunas aceitas para diferentes padrões.
+        metadata_patterns (List[str]): Padrões de metadados (uppercase) a serem localizados.
+        values (Optional[np.ndarray]): Valores da planilha (df.to_numpy), se já convertidos.
+        empty_mask (Optional[np.ndarray]): Máscara de células vazias (pd.isna(values)), se já calculada.
 
     Returns:
-        tuple: Uma tupla (linha, coluna, colunas_encontradas) indicando a posição do cabeçalho e as colunas encontradas,
-               ou (None, None, None) se não encontrado.
-    """
-    for pattern_key in expected_columns:
-        # Normaliza colunas esperadas e alternativas para uppercase
-        normalized_expected = [
-            str(col).upper() if isinstance(col, str) else col
-            for col in expected_columns[pattern_key]
-        ]
-        normalized_alternative = [
-            str(col).upper() if isinstance(col, str) else col
-            for col in alternative_columns[pattern_key]
-        ]
+        tuple: Uma tupla (linha, coluna, padrão, colunas_encontradas, ocorrências), onde ocorrências
+               mapeia cada padrão de metadados às posições (linha, coluna) que o contêm.
+               Se o cabeçalho não for encontrado, os quatro primeiros itens são None.
+    """
+    pattern_keys = list(expected_columns)
 
-        if pattern_key == "default03":
-            pass
+    # Colunas esperadas (tupla) e alternativas (frozenset) normalizadas para uppercase;
+    # para as configurações padrão, reaproveita as versões pré-calculadas na carga do módulo
+    if expected_columns is EXPECTED_COLUMNS:
+        normalized_expected = NORMALIZED_EXPECTED_COLUMNS
+    else:
+        normalized_expected = {
+            key: normalize_header_columns(expected_columns[key]) for key in pattern_keys
+        }
+    if alternative_columns is ALTERNATIVE_COLUMNS:
+        normalized_alternative = NORMALIZED_ALTERNATIVE_COLUMNS
+    else:
+        normalized_alternative = {
+            key: frozenset(normalize_header_columns(alternative_columns[key]))
+            for key in pattern_keys
+        }
+
+    if values is None:
+        values = df.to_numpy(dtype=object)
+    num_rows, num_total_cols = values.shape
+
+    # Máscara de células vazias calculada uma única vez para toda a planilha
+    if empty_mask is None:
+        empty_mask = pd.isna(values)
+
+    # Busca vetorizada do cabeçalho, primeiro nas MAX_HEADER_SCAN_ROWS linhas iniciais
+    # e, apenas se não encontrado, no restante da planilha
+    header = None  # (linha, coluna, padrão, colunas encontradas)
+    header_limit = MAX_HEADER_SCAN_ROWS or num_rows
+    for start, stop in ((0, header_limit), (header_limit, num_rows)):
+        if header is not None or start >= stop:
+            break
 
-        # Número de colunas esperadas
-        num_cols = len(normalized_expected)
+        # Normaliza o bloco para uppercase (vazios viram "", não textos viram None)
+        block_values = values[start:stop]
+        normalized = np.array(
+            [
+                "" if empty else val.upper() if isinstance(val, str) else None
+                for val, empty in zip(
+                    block_values.ravel().tolist(), empty_mask[start:stop].ravel().tolist()
+                )
+            ],
+            dtype=object,
+        ).reshape(block_values.shape)
+
+        for pattern_key in pattern_keys:
+            # Número de colunas esperadas
+            num_cols = len(normalized_expected[pattern_key])
+            if num_cols == 0 or num_cols > num_total_cols:
+                continue
+
+            # Janelas (linha, coluna inicial, num_cols) sem cópia dos dados
+            windows = sliding_window_view(normalized, num_cols, axis=1)
+
+            # Verifica se os valores correspondem às colunas esperadas
+            exact = (windows == np.array(normalized_expected[pattern_key], dtype=object)).all(
+                axis=-1
+            )
 
-        # Itera sobre as linhas do DataFrame
-        for row in range(df.shape[0]):
+            # Verifica colunas alternativas (todas presentes na janela)
+            alternative = np.ones(exact.shape, dtype=bool)
+            for alt in normalized_alternative[pattern_key]:
+                alternative &= (windows == alt).any(axis=-1)
 
-            # Itera sobre as colunas possíveis
-            for col in range(df.shape[1] - num_cols + 1):
+                # Interrompe assim que nenhuma janela puder mais conter todas as colunas
+                if not alternative.any():
+                    break
 
-                # Extrai valores da linha e colunas
-                values = df.iloc[row, col : col + num_cols].tolist()
+            hits = exact | alternative
+            if not hits.any():
+                continue
 
-                # Normaliza os valores extraídos para uppercase
-                normalized = [
-                    "" if pd.isna(val) else str(val).upper() if isinstance(val, str) else val
-                    for val in values
-                ]
+            # Primeira ocorrência (linha a linha, coluna a coluna) deste padrão
+            row, col = np.unravel_index(np.argmax(hits), hits.shape)
+            row, col = int(row), int(col)
 
-                # Verifica se os valores correspondem às colunas esperadas
-                if normalized == normalized_expected:
-                    return row, col, pattern_key, expected_columns[pattern_key]
+            # O cabeçalho é a primeira linha que corresponde a algum padrão;
+            # na mesma linha, vale a ordem de prioridade dos padrões
+            if header is None or start + row < header[0]:
+                columns_found = (
+                    expected_columns[pattern_key]
+                    if exact[row, col]
+                    else alternative_columns[pattern_key]
+                )
+                header = (start + row, col, pattern_key, columns_found)
 
-                # Verifica colunas alternativas
-                if all(col in normalized for col in normalized_alternative):
-                    return row, col, pattern_key, alternative_columns[pattern_key]
+    # Registra as células que contêm os padrões de metadados
+    pattern_hits = find_pattern_positions(values, metadata_patterns, empty_mask=empty_mask)
+
+    if header is not None:
+        row, col, pattern_key, columns_found = header
+        return row, col, pattern_key, columns_found, pattern_hits
 
     # Retorna None se não encontrar o cabeçalho
-    return None, None, None, None
+    return None, None, None, None, pattern_hits
+
+
+# Função para localizar dinamicamente o cabeçalho da tabela no DataFrame
+def locate_table(
+    df: pd.DataFrame,
+    expected_columns: dict = EXPECTED_COLUMNS,
+    alternative_columns: dict = ALTERNATIVE_COLUMNS,
+) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[list]]:
+    """
+    Detecta a posição (linha, coluna) onde o cabeçalho da tabela começa, testando múltiplos padrões de colunas.
+
+    Args:
+        df (pd.DataFrame): DataFrame contendo os dados da planilha.
+        expected_columns (dict): Dicionário com listas de colunas esperadas para diferentes padrões.
+        alternative_columns (dict): Dicionário com listas alternativas mínimas de colunas aceitas para diferentes padrões.
+
+    Returns:
+        tuple: Uma tupla (linha, coluna, padrão, colunas_encontradas) indicando a posição do cabeçalho e as colunas encontradas,
+               ou (None, None, None, None) se não encontrado.
+    """
+    row, col, pattern_key, columns_found, _ = scan_sheet(
+        df,
+        expected_columns=expected_columns,
+        alternative_columns=alternative_columns,
+        metadata_patterns=[],
+    )
+
+    return row, col, pattern_key, columns_found
 
 
 # Função auxiliar para encontrar e atribuir valores de metadados a um dicionário
 def find_metadata_value(
-    row: pd.Series,
+    row: Optional[pd.Series],
     col_idx: int,
     metadata_key: str,
     metadata: Dict[str, Any],
-    df: pd.DataFrame,
+    values: np.ndarray,
     row_idx: int,
     specific_cell: Optional[Tuple[int, int]] = None,
     max_rows_to_iterate: Optional[int] = None,
     expected_type: Union[str, type] = "str",
+    filled_rows: Optional[np.ndarray] = None,
 ) -> None:
     """
     Busca e atribui um valor de metadado ao dicionário, descendo pelas linhas até encontrar o valor
     ou buscando uma célula específica.
 
     Args:
-        row (pd.Series): Linha do DataFrame.
+        row (Optional[pd.Series]): Linha do DataFrame (não utilizada na busca).
         col_idx (int): Índice da coluna atual.
         metadata_key (str): Chave do metadado a ser buscado.
         metadata (dict): Dicionário de metadados.
-        df (pd.DataFrame): DataFrame completo para buscar o valor nas linhas subsequentes.
+        values (np.ndarray): Valores da aba (DataFrame.to_numpy) para buscar o valor nas linhas subsequentes.
         row_idx (int): Índice da linha atual no DataFrame.
         specific_cell (Optional[Tuple[int, int]]): Coordenadas (linha, coluna) de uma célula específica a ser buscada.
         max_rows_to_iterate (Optional[int]): Número máximo de linhas para iterar ao buscar o valor.
         expected_type (Union[str, type]): Tipo esperado do valor a ser convertido.
+        filled_rows (Optional[np.ndarray]): Posições das linhas não vazias de values. Quando
+            informado, specific_cell e max_rows_to_iterate contam apenas essas linhas, como se
+            as linhas em branco tivessem sido removidas.
     """
     # Verifica se o metadado já foi atribuído
     if metadata[metadata_key] is not None:
         return
 
+    num_rows, num_cols = values.shape
+
     if specific_cell:
         # Busca o valor na célula específica
         specific_row, specific_col = specific_cell
-        if 0 <= specific_row < len(df) and 0 <= specific_col < len(df.columns):
-            value = df.iloc[specific_row, specific_col]
+        if filled_rows is not None:
+            # Converte a linha (contada sem as linhas em branco) para a posição na aba
+            if not 0 <= specific_row < len(filled_rows):
+                return
+            specific_row = int(filled_rows[specific_row])
+        if 0 <= specific_row < num_rows and 0 <= specific_col < num_cols:
+            value = values[specific_row, specific_col]
             if not pd.isna(value):
 
                 # Converte o valor para o tipo esperado
@@ -306,22 +594,29 @@ def find_metadata_value(
                 metadata[metadata_key] = str(value).upper()
         return
 
-    # Itera pelas linhas subsequentes
-    rows_to_iterate = range(row_idx + 1, len(df))
+    # Define as linhas subsequentes a serem consideradas
+    last_row = num_rows
     if max_rows_to_iterate is not None:
-        rows_to_iterate = range(row_idx + 1, min(row_idx + 1 + max_rows_to_iterate, len(df)))
+        if filled_rows is not None:
+            # Conta apenas as linhas não vazias abaixo da linha atual
+            last_position = np.searchsorted(filled_rows, row_idx) + max_rows_to_iterate
+            if last_position < len(filled_rows):
+                last_row = int(filled_rows[last_position]) + 1
+        else:
+            last_row = min(row_idx + 1 + max_rows_to_iterate, num_rows)
 
-    for next_row_idx in rows_to_iterate:
-        # Obtém o valor da célula na linha subsequente
-        value = df.iloc[next_row_idx, col_idx]
-        if not pd.isna(value):  # Verifica se o valor não é NaN
+    # Localiza a primeira célula preenchida abaixo com uma única máscara vetorizada
+    column_values = values[row_idx + 1 : last_row, col_idx]
+    filled = np.flatnonzero(~pd.isna(column_values))
+    if filled.size:
+        # Obtém o valor da primeira célula preenchida na coluna
+        value = column_values[filled[0]]
 
-            # Converte o valor para o tipo esperado
-            if expected_type:
-                value = convert_value(str(value), expected_type)
+        # Converte o valor para o tipo esperado
+        if expected_type:
+            value = convert_value(str(value), expected_type)
 
-            metadata[metadata_key] = str(value).upper()  # Atribui o valor encontrado em uppercase
-            break
+        metadata[metadata_key] = str(value).upper()  # Atribui o valor encontrado em uppercase
 
 
 # Função para extrair metadados dinamicamente do DataFrame
@@ -331,6 +626,9 @@ def extract_metadata(
     sheet_name_selected: str,
     metadata_keys: dict = DEFAULT_METADATA_KEYS,
     pattern_key: str = "default01",
+    pattern_hits: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+    values: Optional[np.ndarray] = None,
+    filled_rows: Optional[np.ndarray] = None,
 ) -> Dict[str, Optional[Any]]:
     """
     Extrai metadados da tabela de orçamento de forma genérica e dinâmica.
@@ -341,6 +639,11 @@ def extract_metadata(
         sheet_name_selected (str): Nome da aba atual sendo processada.
         metadata_keys (dict): Dicionário com as chaves de metadados e suas configurações.
         pattern_key (str): Chave do padrão de metadados a ser usado.
+        pattern_hits (Optional[dict]): Ocorrências dos padrões na aba selecionada, obtidas por
+            scan_sheet. Quando informado, evita uma nova varredura da aba.
+        values (Optional[np.ndarray]): Valores de df (df.to_numpy), se já convertidos.
+        filled_rows (Optional[np.ndarray]): Posições das linhas não vazias de df, quando df
+            mantém as linhas em branco (preprocess_data com drop_empty_rows=False).
 
     Returns:
         dict: Dicionário contendo os metadados extraídos.
@@ -351,49 +654,88 @@ def extract_metadata(
     # Inicializa o dicionário de metadados
     metadata = {key: None for key in selected_metadata_keys}
 
+    # Converte cada aba para NumPy uma única vez (evita iterrows/iloc por célula)
+    values_by_sheet = {sheet_name_selected: df.to_numpy(dtype=object) if values is None else values}
+    hits_by_sheet = {}
+
+    # Padrões (uppercase) buscados nas abas sem ocorrências pré-calculadas
+    if metadata_keys is DEFAULT_METADATA_KEYS and pattern_key in METADATA_PATTERNS_BY_KEY:
+        selected_patterns = METADATA_PATTERNS_BY_KEY[pattern_key]
+    else:
+        selected_patterns = tuple(
+            dict.fromkeys(config["pattern"].upper() for config in selected_metadata_keys.values())
+        )
+
     for key, config in selected_metadata_keys.items():
         # Determina o DataFrame a ser usado com base na aba especificada no padrão
         sheet_name = config.get("sheet_name", None)
         if sheet_name in raw_df.keys() and sheet_name != sheet_name_selected:
-            source_df = raw_df[sheet_name]
+            source_sheet = sheet_name
+        else:
+            source_sheet = sheet_name_selected
+
+        if source_sheet not in values_by_sheet:
+            values_by_sheet[source_sheet] = raw_df[source_sheet].to_numpy(dtype=object)
+        source_values = values_by_sheet[source_sheet]
+
+        # Apenas a aba selecionada é pré-processada (linhas contadas sem as linhas em branco)
+        source_filled_rows = filled_rows if source_sheet == sheet_name_selected else None
+
+        # Obtém o padrão, método de busca e tipo esperado
+        pattern = config["pattern"]
+        method = config.get("method", "iterate")
+        expected_type = config.get("type", "str")
+
+        # Método "specific_cell": o valor independe da célula onde o padrão aparece
+        if method == "specific_cell":
+            if config.get("specific_cell") is not None:
+                find_metadata_value(
+                    row=None,
+                    col_idx=0,
+                    metadata_key=key,
+                    metadata=metadata,
+                    values=source_values,
+                    row_idx=0,
+                    specific_cell=config.get("specific_cell"),
+                    max_rows_to_iterate=config.get("max_rows"),
+                    expected_type=expected_type,
+                    filled_rows=source_filled_rows,
+                )
+            continue
+
+        # Reaproveita as ocorrências da varredura da aba selecionada, quando disponíveis
+        if (
+            pattern_hits is not None
+            and source_sheet == sheet_name_selected
+            and pattern.upper() in pattern_hits
+        ):
+            positions = pattern_hits[pattern.upper()]
         else:
-            source_df = df
-
-        # Itera sobre as linhas do DataFrame selecionado
-        for row_idx, row in source_df.iterrows():
-            for col_idx, cell in enumerate(row):
-                # Ignora células vazias
-                if pd.isna(cell):
-                    continue
-
-                # Normaliza o valor da célula para uppercase
-                cell_str = str(cell).strip().upper()
-
-                # Obtém o padrão, método de busca e tipo esperado
-                pattern = config["pattern"]
-                method = config.get("method", "iterate")
-                expected_type = config.get("type", "str")
-
-                # Verifica se o padrão está na célula atual ou se o método é "specific_cell"
-                if metadata[key] is None and (
-                    pattern.upper() in cell_str or method == "specific_cell"
-                ):
-                    if method == "specific_cell" and config.get("specific_cell") is None:
-                        metadata[key] = None
-                        continue
-
-                    # Busca o valor do metadado com base na configuração
-                    find_metadata_value(
-                        row=row,
-                        col_idx=col_idx,
-                        metadata_key=key,
-                        metadata=metadata,
-                        df=source_df,
-                        row_idx=row_idx,
-                        specific_cell=config.get("specific_cell"),
-                        max_rows_to_iterate=config.get("max_rows"),
-                        expected_type=expected_type,
-                    )
+            # Localiza todos os padrões da aba de uma só vez (calculado uma única vez por aba)
+            if source_sheet not in hits_by_sheet:
+                hits_by_sheet[source_sheet] = find_pattern_positions(
+                    source_values, selected_patterns
+                )
+            positions = hits_by_sheet[source_sheet][pattern.upper()]
+
+        for row_idx, col_idx in positions:
+            # Busca o valor do metadado com base na configuração
+            find_metadata_value(
+                row=None,
+                col_idx=col_idx,
+                metadata_key=key,
+                metadata=metadata,
+                values=source_values,
+                row_idx=row_idx,
+                specific_cell=None,
+                max_rows_to_iterate=config.get("max_rows"),
+                expected_type=expected_type,
+                filled_rows=source_filled_rows,
+            )
+
+            # Interrompe a busca assim que o metadado for encontrado
+            if metadata[key] is not None:
+                break
 
     return metadata
 
@@ -439,8 +781,10 @@ def extract_table(
     header_row: int,
     first_col: int,
     columns_found: list,
-    col_filter: str = FILTROS,
+    col_filter: Dict[str, Any] = FILTROS,
     pattern_key: str = PATTERN_DEFAULT,
+    values: Optional[np.ndarray] = None,
+    filled_rows: Optional[np.ndarray] = None,
 ) -> pd.DataFrame:
     """
     A partir da posição do cabeçalho, extrai a tabela até as linhas vazias.
@@ -451,6 +795,9 @@ def extract_table(
         first_col (int): Coluna onde o cabeçalho da tabela começa.
         columns_found (list): Lista de colunas encontradas no cabeçalho.
         col_filter (str): Nome da coluna usada para filtrar linhas vazias.
+        pattern_key (str): Chave do padrão de cabeçalho encontrado.
+        values (Optional[np.ndarray]): Valores de df (df.to_numpy), se já convertidos.
+        filled_rows (Optional[np.ndarray]): Posições das linhas não vazias de df, se já calculadas.
 
     Returns:
         pd.DataFrame: DataFrame contendo apenas a tabela extraída e processada.
@@ -459,14 +806,27 @@ def extract_table(
     # Número de colunas encontradas
     num_cols = len(columns_found)
 
-    # Define o cabeçalho a partir da linha encontrada
-    header = df.iloc[header_row, :].tolist()
+    if values is None:
+        values = df.to_numpy(dtype=object)
 
-    # Extrai os dados abaixo do cabeçalho
-    data = df.iloc[header_row + 1 :, :].copy()
+    # Define o cabeçalho a partir da linha encontrada (células vazias viram "")
+    header = ["" if pd.isna(value) else value for value in values[header_row].tolist()]
+
+    # Mantém apenas as colunas que serão renomeadas ou selecionadas no resultado
+    rename_dict = DICT_RENAME.get(pattern_key, {}).get("dict_rename", {})
+    keep_cols = [
+        idx for idx, value in enumerate(header) if value in rename_dict or value in SELECTED_COLUMNS
+    ]
 
-    # Define o cabeçalho no DataFrame
-    data.columns = header
+    # Linhas não vazias abaixo do cabeçalho (as linhas totalmente em branco são descartadas)
+    if filled_rows is None:
+        filled_rows = np.flatnonzero(~pd.isna(values).all(axis=1))
+    data_rows = filled_rows[filled_rows > header_row]
+
+    # Extrai os dados abaixo do cabeçalho já no tamanho final (uma única cópia)
+    data = pd.DataFrame(
+        values[np.ix_(data_rows, keep_cols)], columns=[header[idx] for idx in keep_cols]
+    )
 
     # Renomeia o nome das colunas para manter consistência
     data = rename_and_select_columns(
@@ -480,42 +840,170 @@ def extract_table(
     return post_process_table(data, col_filter=col_filter)
 
 
-def apply_filter(data: pd.DataFrame, col: str, filter_value: Any) -> pd.DataFrame:
+# Função para normalizar, de forma vetorizada, os valores de texto comparados pelos filtros
+def normalize_filter_values(values: pd.Series) -> pd.Series:
     """
-    Aplica um filtro resiliente a uma coluna do DataFrame.
+    Converte a coluna para string (pyarrow) e aplica strip e lowercase em uma única passada
+    vetorizada, sem criar um objeto Python por célula.
+
+    Args:
+        values (pd.Series): Coluna a ser normalizada.
+
+    Returns:
+        pd.Series: Coluna normalizada, com dtype ARROW_STRING_DTYPE.
+    """
+    return values.astype(ARROW_STRING_DTYPE).str.strip().str.lower()
+
+
+# Função para converter as colunas da tabela extraída para tipos numéricos e string (pyarrow)
+def convert_result_dtypes(
+    data: pd.DataFrame,
+    numeric_columns: Sequence[str] = NUMERIC_RESULT_COLUMNS,
+    string_columns: Sequence[str] = STRING_RESULT_COLUMNS,
+    downcast: bool = DOWNCAST_NUMERIC_COLUMNS,
+) -> pd.DataFrame:
+    """
+    Converte as colunas da tabela consolidada (object) para tipos numéricos e string (pyarrow),
+    evitando novas conversões (pd.to_numeric) nas etapas seguintes e reduzindo o uso de memória.
+
+    A conversão é feita uma única vez sobre a tabela concatenada (concat_tables), garantindo um
+    único tipo por coluna no resultado. As colunas numéricas são sempre float64 (float32 com
+    downcast), independentemente de os valores de um arquivo serem inteiros.
+
+    Apenas conversões sem perda são aplicadas: a coluna numérica é mantida como object se algum
+    valor preenchido não for numérico, e a coluna de texto se algum valor preenchido não for string.
+
+    Args:
+        data (pd.DataFrame): Tabela extraída.
+        numeric_columns (Sequence[str]): Colunas convertidas para numérico.
+        string_columns (Sequence[str]): Colunas convertidas para ARROW_STRING_DTYPE.
+        downcast (bool): Reduz as colunas numéricas para float32.
+
+    Returns:
+        pd.DataFrame: Tabela com as colunas convertidas.
+    """
+    for col in numeric_columns:
+        if col in data.columns:
+            converted = pd.to_numeric(data[col], errors="coerce").astype(
+                "float32" if downcast else "float64"
+            )
+
+            # Converte apenas se nenhum valor preenchido for perdido na conversão
+            if converted.isna().sum() == data[col].isna().sum():
+                data[col] = converted
+
+    for col in string_columns:
+        # Colunas apenas com texto (ou totalmente vazias) viram string, sem perda de valores
+        if col in data.columns and pd.api.types.infer_dtype(data[col], skipna=True) in (
+            "string",
+            "empty",
+        ):
+            data[col] = data[col].astype(ARROW_STRING_DTYPE)
+
+    return data
+
+
+# Função para compilar um filtro de pós-processamento em uma função de máscara
+def compile_filter(
+    col: str, filter_value: Any
+) -> Optional[Callable[[pd.DataFrame], Optional[pd.Series]]]:
+    """
+    Converte a definição textual de um filtro em uma função que gera a máscara booleana.
+
+    A interpretação da condição (e.g., "greater_than:0") é feita uma única vez. Os filtros de
+    igualdade comparam, com isin, os valores normalizados (strip e lowercase) da coluna
+    com o conjunto de valores aceitos, normalizados da mesma forma.
 
     Args:
-        data (pd.DataFrame): DataFrame contendo os dados.
         col (str): Nome da coluna a ser filtrada.
         filter_value (Any): Valor ou condição de filtro (e.g., "greater_than:0", "less_than:10", "equal:SIM", ["SIM", "sim"]).
 
     Returns:
-        pd.DataFrame: DataFrame filtrado.
+        Optional[Callable]: Função que recebe o DataFrame e retorna a máscara booleana (ou None
+                            quando o filtro não se aplica à coluna), ou None se o filtro for inválido.
     """
     try:
         # Verifica se o filtro é uma string com uma condição
         if isinstance(filter_value, str):
             if "greater_than:" in filter_value:
                 threshold = float(filter_value.split(":")[1])
-                # Verifica se os valores da coluna podem ser convertidos para numéricos
-                numeric_col = pd.to_numeric(data[col], errors="coerce")
-                return data[numeric_col > threshold]
+                # Converte os valores da coluna para numéricos antes da comparação
+                return lambda data: pd.to_numeric(data[col], errors="coerce") > threshold
             elif "less_than:" in filter_value:
                 threshold = float(filter_value.split(":")[1])
-                # Verifica se os valores da coluna podem ser convertidos para numéricos
-                numeric_col = pd.to_numeric(data[col], errors="coerce")
-                return data[numeric_col < threshold]
+                # Converte os valores da coluna para numéricos antes da comparação
+                return lambda data: pd.to_numeric(data[col], errors="coerce") < threshold
             elif "equal:" in filter_value:
-                target = filter_value.split(":")[1].lower()
-                if pd.api.types.is_string_dtype(data[col]):
-                    return data[data[col].str.lower() == target]
+                accepted_values = [filter_value.split(":")[1].strip().lower()]
+            else:
+                return None
         # Verifica se o filtro é uma lista de valores
         elif isinstance(filter_value, list):
-            if pd.api.types.is_string_dtype(data[col]):
-                lower_filter = [val.lower() for val in filter_value]
-                return data[data[col].str.lower().isin(lower_filter)]
+            accepted_values = list({str(val).strip().lower() for val in filter_value})
+        else:
+            return None
+
+        return lambda data: (
+            normalize_filter_values(data[col]).isin(accepted_values).fillna(False).astype(bool)
+            if pd.api.types.is_string_dtype(data[col])
+            else None
+        )
     except Exception as e:
-        print(f"Erro ao aplicar filtro na coluna '{col}': {e}")
+        logger.warning(f"Filtro inválido para a coluna '{col}': {e}")
+
+    return None
+
+
+# Função para compilar o dicionário de filtros de pós-processamento
+def compile_filters(
+    col_filter: Dict[str, Any],
+) -> Dict[str, Callable[[pd.DataFrame], Optional[pd.Series]]]:
+    """
+    Compila todos os filtros de um dicionário, descartando os inválidos.
+
+    Args:
+        col_filter (dict): Dicionário onde a chave é o nome da coluna e o valor pode ser uma string ou uma lista de valores filtráveis.
+
+    Returns:
+        dict: Dicionário com o nome da coluna e a função de máscara correspondente.
+    """
+    compiled = {}
+    for col, filter_value in col_filter.items():
+        mask_function = (
+            filter_value if callable(filter_value) else compile_filter(col, filter_value)
+        )
+        if mask_function is not None:
+            compiled[col] = mask_function
+    return compiled
+
+
+# Filtros no pós processamento, compilados uma única vez
+COMPILED_FILTROS = compile_filters(FILTROS)
+
+
+def apply_filter(data: pd.DataFrame, col: str, filter_value: Any) -> pd.DataFrame:
+    """
+    Aplica um filtro resiliente a uma coluna do DataFrame.
+
+    Args:
+        data (pd.DataFrame): DataFrame contendo os dados.
+        col (str): Nome da coluna a ser filtrada.
+        filter_value (Any): Valor ou condição de filtro (e.g., "greater_than:0", "less_than:10", "equal:SIM", ["SIM", "sim"])
+                            ou uma função de máscara já compilada.
+
+    Returns:
+        pd.DataFrame: DataFrame filtrado.
+    """
+    mask_function = filter_value if callable(filter_value) else compile_filter(col, filter_value)
+    if mask_function is None:
+        return data
+
+    try:
+        mask = mask_function(data)
+        if mask is not None:
+            return data[mask]
+    except Exception as e:
+        logger.warning(f"Erro ao aplicar filtro na coluna '{col}': {e}")
 
     return data
 
@@ -526,7 +1014,8 @@ def post_process_table(data: pd.DataFrame, col_filter: Dict[str, Any] = FILTROS)
 
     Args:
         data (pd.DataFrame): DataFrame contendo os dados extraídos da tabela.
-        col_filter (dict): Dicionário onde a chave é o nome da coluna e o valor pode ser uma string ou uma lista de valores filtráveis.
+        col_filter (dict): Dicionário onde a chave é o nome da coluna e o valor pode ser uma string, uma lista de valores filtráveis
+                           ou uma função de máscara compilada (ver compile_filters).
 
     Returns:
         pd.DataFrame: DataFrame pós-processado com filtros aplicados.
@@ -544,58 +1033,96 @@ def post_process_table(data: pd.DataFrame, col_filter: Dict[str, Any] = FILTROS)
     return data.reset_index(drop=True)
 
 
+def read_raw_sheets(
+    file_path: str, sheet_name: Optional[str] = None, engine: Optional[str] = None
+) -> Tuple[Optional[Dict[str, pd.DataFrame]], Optional[str]]:
+    """
+    Lê, sem cabeçalho, a aba selecionada e as abas referenciadas pelos metadados.
+
+    O arquivo é aberto uma única vez; apenas as abas necessárias são materializadas.
+    As células são lidas como objetos (dtype=object), sem inferência de tipos.
+
+    Args:
+        file_path (str): Caminho do arquivo da planilha.
+        sheet_name (Optional[str]): Nome da aba a ser lida (vazio para testar SHEET_NAMES_TRY).
+        engine (Optional[str]): Engine do pandas. None usa openpyxl para .xlsx/.xlsm
+                                e o engine padrão do pandas para os demais formatos.
+
+    Returns:
+        tuple: Dicionário com as abas brutas lidas e o nome da aba selecionada,
+               ou (None, None) se a aba não for encontrada.
+    """
+    # Engine openpyxl apenas para formatos OOXML (.xls continua com o engine padrão)
+    if engine is None and Path(file_path).suffix.lower() in (".xlsx", ".xlsm"):
+        engine = "openpyxl"
+
+    with pd.ExcelFile(
+        file_path,
+        engine=engine,
+        engine_kwargs=EXCEL_OPENPYXL_KWARGS if engine == "openpyxl" else None,
+    ) as xl:
+
+        if not sheet_name:
+            # Tenta ler abas comuns se nenhuma aba for especificada
+            sheet = next((name for name in SHEET_NAMES_TRY if name in xl.sheet_names), None)
+        else:
+            sheet = sheet_name
+
+        if sheet not in xl.sheet_names:
+            logger.warning(f"Aba '{sheet}' não encontrada. Abas disponíveis: {xl.sheet_names}")
+            return None, None
+
+        # Lê a aba selecionada e as abas referenciadas pelos metadados
+        sheets_to_read = [sheet] + [
+            name for name in METADATA_SHEET_NAMES if name in xl.sheet_names and name != sheet
+        ]
+        raw_df = {name: xl.parse(name, header=None, dtype=object) for name in sheets_to_read}
+
+    return raw_df, sheet
+
+
 def read_data_budget(
     file_path: str, sheet_name: str = DEFAULT_SHEET_NAME, header: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Lê a planilha e retorna o DataFrame bruto.
 
+    Apenas a aba selecionada e as abas referenciadas pelos metadados são lidas,
+    evitando materializar todas as abas do arquivo. A leitura usa o engine
+    EXCEL_ENGINE e, em caso de falha, o engine padrão (openpyxl).
+
     Args:
         file_path (str): Caminho do arquivo da planilha.
-        sheet_name (str): Nome da aba a ser lida.
+        sheet_name (str): Nome da aba a ser lida (vazio para testar SHEET_NAMES_TRY).
 
     Returns:
-        pd.DataFrame: DataFrame bruto lido da planilha.
+        tuple: Dicionário com as abas brutas lidas, DataFrame pré-processado da aba
+               selecionada e nome da aba selecionada (ou (None, None, None)).
     """
 
-    # Inicializa o DataFrame da aba selecionada
-    df_selected_sheet = None
-
-    # Lê a planilha sem cabeçalho
-    raw_df = read_data(file_path, sheet_name=sheet_name, header=None)
-
-    if isinstance(raw_df, pd.DataFrame) or isinstance(raw_df, dict):
+    try:
+        # Leitura principal com o engine configurado (calamine, em Rust, é o padrão)
+        raw_df, sheet = read_raw_sheets(
+            file_path=file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE
+        )
+    except Exception as e:
+        logger.warning(
+            f"Falha ao ler o arquivo {file_path} com o engine '{EXCEL_ENGINE}': {e}. "
+            "Tentando novamente com o engine padrão."
+        )
+        raw_df, sheet = read_raw_sheets(file_path=file_path, sheet_name=sheet_name, engine=None)
 
-        if sheet_name is None:
-            # Tenta ler abas comuns se nenhuma aba for especificada
-            for sheet in SHEET_NAMES_TRY:
-                try:
-                    if sheet in raw_df.keys():
-                        df_selected_sheet = raw_df[sheet]
-                        logger.info(f"Aba '{sheet}' encontrada e lida com sucesso.")
-                        break
-                except Exception as e:
-                    logger.warning(f"Aba '{sheet}' não encontrada: {e}")
-        else:
-            """
-            A leitura já foi feita exatamente da aba especificada
-            Para manter as variáveis consistentes, fazemos a cópia do raw_df
-            copy() garante que df_selected_sheet é um DataFrame independente (ponteiro separado)
-            """
-            df_selected_sheet = raw_df.copy()
-            sheet = sheet_name
-            logger.info(f"Aba '{sheet_name}' encontrada e lida com sucesso.")
+    if raw_df is None:
+        # Não encontrou uma aba válida para análise
+        return None, None, None
 
-        if isinstance(df_selected_sheet, pd.DataFrame):
-            # Pré-processa os dados
-            df_selected_sheet = preprocess_data(df_selected_sheet)
+    logger.info(f"Aba '{sheet}' encontrada e lida com sucesso.")
 
-            return raw_df, df_selected_sheet, sheet
-        else:
-            # Não encontrou um dataframe válido para análise
-            return None, None, None
+    # Pré-processa os dados mantendo as linhas em branco (evita uma cópia completa da aba);
+    # as etapas seguintes ignoram essas linhas a partir da máscara de células vazias
+    df_selected_sheet = preprocess_data(raw_df[sheet].copy(), drop_empty_rows=False)
 
-    return None, None, None
+    return raw_df, df_selected_sheet, sheet
 
 
 # Função para ler a tabela de orçamento do arquivo e aba especificados
@@ -619,16 +1146,24 @@ def read_budget_table(
 
     if isinstance(df_selected_sheet, pd.DataFrame):
 
-        # Localiza o cabeçalho da tabela
+        # Converte a aba para NumPy uma única vez, compartilhada pelas etapas seguintes
+        values = df_selected_sheet.to_numpy(dtype=object)
+
+        # Máscara de células vazias e posições das linhas não vazias (a aba mantém as linhas em branco)
+        empty_mask = pd.isna(values)
+        filled_rows = np.flatnonzero(~empty_mask.all(axis=1))
+
+        # Localiza o cabeçalho da tabela e as ocorrências de metadados em uma única varredura
         (
             row,
             col,
             pattern,
             columns_found,
-        ) = locate_table(df_selected_sheet)
+            pattern_hits,
+        ) = scan_sheet(df_selected_sheet, values=values, empty_mask=empty_mask)
 
         # Verifica se o cabeçalho foi encontrado
-        if row:
+        if row is not None:
             # Extrai os metadados
             metadata = extract_metadata(
                 raw_df=raw_df,
@@ -636,6 +1171,9 @@ def read_budget_table(
                 sheet_name_selected=sheet_name,
                 metadata_keys=DEFAULT_METADATA_KEYS,
                 pattern_key=pattern,
+                pattern_hits=pattern_hits,
+                values=values,
+                filled_rows=filled_rows,
             )
 
             # Extrai a tabela
@@ -644,8 +1182,10 @@ def read_budget_table(
                 header_row=row,
                 first_col=col,
                 columns_found=columns_found,
-                col_filter=FILTROS,
+                col_filter=COMPILED_FILTROS,
                 pattern_key=pattern,
+                values=values,
+                filled_rows=filled_rows,
             )
 
             # Retorna a tabela e os metadados
@@ -681,16 +1221,13 @@ def save_results(output_path, output_file, data_result, metadata_result):
         # Salva os dados no arquivo de saída em abas separadas usando export_data
         export_data(
             {
-                settings.get(
-                    "default_budget_reader.result.name_sheet_output_tables", "Tables"
-                ): data_result,
-                settings.get(
-                    "default_budget_reader.result.name_sheet_output_metadata", "Metadata"
-                ): metadata_result,
+                NAME_SHEET_OUTPUT_TABLES: data_result,
+                NAME_SHEET_OUTPUT_METADATA: metadata_result,
             },
             output_path,
             create_dirs=True,
             index=False,
+            engine=EXCEL_WRITER_ENGINE,
         )
 
         # Loga o sucesso na exportação
@@ -699,6 +1236,38 @@ def save_results(output_path, output_file, data_result, metadata_result):
         logger.error(f"Erro ao salvar os resultados em {output_path}: {e}")
 
 
+# Função para concatenar as tabelas processadas, identificando o arquivo e a aba de origem
+def concat_tables(all_tables: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatena as tabelas processadas em uma única chamada de pd.concat, preenche as colunas
+    de arquivo e aba de origem com um único array por coluna (np.repeat) e converte os tipos
+    das colunas do resultado (convert_result_dtypes).
+
+    A origem de cada tabela é lida de table.attrs ("source_file" e "sheet_name"), preenchidos
+    por append_data.
+
+    Args:
+        all_tables (List[pd.DataFrame]): Lista de DataFrames contendo as tabelas processadas.
+
+    Returns:
+        pd.DataFrame: DataFrame concatenado com as colunas de origem preenchidas.
+    """
+    # Concatena todas as tabelas em uma única alocação
+    data_result = concat_dataframes(dataframes=all_tables, ignore_index=True, fill_missing=False)
+
+    # Repete a origem de cada tabela pelo seu número de linhas, alinhado ao resultado
+    lengths = [len(table) for table in all_tables]
+    source_files = np.array([table.attrs.get("source_file") for table in all_tables], dtype=object)
+    sheet_names = np.array([table.attrs.get("sheet_name") for table in all_tables], dtype=object)
+
+    # Preenche as colunas de origem de uma só vez
+    data_result[SOURCE_FILE_COLUMN_NAME] = np.repeat(source_files, lengths)
+    data_result[SHEET_NAME_COLUMN_NAME] = np.repeat(sheet_names, lengths)
+
+    # Converte as colunas uma única vez, com um único tipo por coluna para todos os arquivos
+    return convert_result_dtypes(data_result)
+
+
 # Função para adicionar e salvar resultados processados em um arquivo
 def append_and_save_results(
     all_tables: List[pd.DataFrame],
@@ -719,7 +1288,7 @@ def append_and_save_results(
         None
     """
     # Concatena todas as tabelas
-    data_result = concat_dataframes(dataframes=all_tables, ignore_index=True, fill_missing=False)
+    data_result = concat_tables(all_tables)
 
     # Seleciona apenas as colunas desejadas
     data_result = select_columns(data_result, target_columns=SELECTED_COLUMNS)
@@ -758,7 +1327,7 @@ def append_and_save_results_json(
         None
     """
     # Concatena todas as tabelas
-    data_result = concat_dataframes(dataframes=all_tables, ignore_index=True)
+    data_result = concat_tables(all_tables)
 
     # Seleciona apenas as colunas desejadas
     data_result = select_columns(data_result, target_columns=SELECTED_COLUMNS)
@@ -779,12 +1348,8 @@ def append_and_save_results_json(
         # Salva os dados no arquivo de saída em abas separadas usando export_data
         export_to_json(
             {
-                settings.get(
-                    "default_budget_reader.result.name_sheet_output_tables", "Tables"
-                ): data_result.to_dict(orient="records"),
-                settings.get(
-                    "default_budget_reader.result.name_sheet_output_metadata", "Metadata"
-                ): metadata_result.to_dict(orient="records"),
+                NAME_SHEET_OUTPUT_TABLES: data_result.to_dict(orient="records"),
+                NAME_SHEET_OUTPUT_METADATA: metadata_result.to_dict(orient="records"),
             },
             file_path=output_path,
         )
@@ -799,7 +1364,7 @@ def append_and_save_results_json(
 
 def append_data(list_all_tables, list_all_metadata, file_input, table, metadata):
     """
-    Adiciona informações de arquivo e aba à tabela extraída e aos metadados, e os adiciona às respectivas listas.
+    Adiciona informações de arquivo e aba à tabela extraída (em table.attrs) e aos metadados, e os adiciona às respectivas listas.
 
     Args:
         list_all_tables (List): Lista para armazenar todas as tabelas processadas.
@@ -811,26 +1376,20 @@ def append_data(list_all_tables, list_all_metadata, file_input, table, metadata)
     Returns:
         Tuple[List, List]: Listas atualizadas com a nova tabela e os novos metadados adicionados.
     """
+    # Nome do arquivo de origem (calculado uma única vez)
+    source_name = Path(file_input.file_path).name
+
     # Adiciona o nome do arquivo e o nome da aba aos metadados
     metadata_with_source = metadata.copy()
-    metadata_with_source["SOURCE_FILE"] = Path(file_input.file_path).name
+    metadata_with_source["SOURCE_FILE"] = source_name
     metadata_with_source["SHEET_NAME"] = file_input.sheet_name
 
     # Adiciona os metadados à lista de metadados
     list_all_metadata.append(metadata_with_source)
 
-    # Adiciona o nome do arquivo como coluna na tabela
-    table[settings.get("default_budget_reader.SOURCE_FILE_COLUMN_NAME", "SOURCE_FILE")] = Path(
-        file_input.file_path
-    ).name
-
-    # Adiciona o nome da aba como coluna na tabela
-    table[settings.get("default_budget_reader.SHEET_NAME_COLUMN_NAME", "SHEET_NAME")] = (
-        file_input.sheet_name
-    )
-
-    # Resetando o index da tabela
-    table.reset_index(drop=True, inplace=True)
+    # Registra a origem da tabela; as colunas são preenchidas na concatenação (concat_tables)
+    table.attrs["source_file"] = source_name
+    table.attrs["sheet_name"] = file_input.sheet_name
 
     # Adiciona a tabela à lista de tabelas
     list_all_tables.append(table)
@@ -870,23 +1429,100 @@ def get_files_from_directory(
     if not dir_path.is_dir():
         raise ValueError(f"O caminho fornecido não é um diretório válido: {directory}")
 
-    # Obtém todos os arquivos no diretório (e subdiretórios, se especificado)
-    if recursive:
-        # Busca recursiva em subdiretórios
-        files = dir_path.rglob("*")
-    else:
-        # Busca apenas no diretório solicitado
-        files = dir_path.iterdir()
+    files = []
+
+    # Percorre o diretório com os.scandir, aplicando todos os filtros em uma única passada
+    def scan(current_dir: str) -> None:
+        with os.scandir(current_dir) as iterator:
+            entries = list(iterator)
+
+        for entry in entries:
+            name = entry.name
+            if (
+                entry.is_file()
+                and (not extension or os.path.splitext(name)[1] in extension)
+                and (not prefix or name.startswith(prefix))
+                and (not suffix or name.endswith(suffix))
+            ):
+                files.append(Path(entry.path))
+
+        # Busca recursiva em subdiretórios (sem seguir links simbólicos)
+        if recursive:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    scan(entry.path)
+
+    scan(str(dir_path))
 
-    # Filtra apenas arquivos com base nos critérios fornecidos
-    if extension:
-        files = filter(lambda f: f.suffix in extension, files)
-    if prefix:
-        files = filter(lambda f: f.name.startswith(prefix), files)
-    if suffix:
-        files = filter(lambda f: f.name.endswith(suffix), files)
+    return files
 
-    return list(files)
+
+# Função para processar um único arquivo de orçamento
+def process_file(
+    file_path: str, sheet_name: Optional[str] = None
+) -> Optional[Tuple[pd.DataFrame, Dict[str, Optional[Any]], str, str]]:
+    """
+    Processa um único arquivo de orçamento.
+
+    Função pura e definida no nível do módulo para poder ser executada em processos
+    separados por orchestrate_budget_reader.
+
+    Args:
+        file_path (str): Caminho do arquivo.
+        sheet_name (Optional[str]): Nome da aba a ser lida.
+
+    Returns:
+        Optional[tuple]: Tupla (tabela, metadados, caminho do arquivo, aba lida),
+                         ou None se a tabela não for encontrada.
+    """
+    logger.info(f"Iniciando o processamento do arquivo: {file_path}")
+
+    # Lê a tabela de orçamento do arquivo
+    table, sheet_name, metadata = read_budget_table(file_path=file_path, sheet_name=sheet_name)
+
+    if isinstance(table, pd.DataFrame):
+        return table, metadata, file_path, sheet_name
+
+    return None
+
+
+# Função para remover os sinks de log herdados pelos processos de leitura
+def _init_worker_logger() -> None:
+    """
+    Remove os sinks herdados pelo processo de leitura, evitando que vários processos
+    escrevam nos mesmos arquivos de log. Os logs são emitidos pelo processo principal.
+    """
+    logger.remove()
+
+
+# Função para processar um arquivo em um processo separado, devolvendo os logs gerados
+def _process_file_in_worker(
+    file_path: str, sheet_name: Optional[str] = None
+) -> Tuple[
+    Optional[Tuple[pd.DataFrame, Dict[str, Optional[Any]], str, str]], List[Tuple[str, str]]
+]:
+    """
+    Executa process_file coletando as mensagens de log, que são devolvidas ao processo
+    principal em vez de escritas pelo próprio processo de leitura.
+
+    Args:
+        file_path (str): Caminho do arquivo.
+        sheet_name (Optional[str]): Nome da aba a ser lida.
+
+    Returns:
+        tuple: Resultado de process_file e lista de mensagens de log (nível, mensagem).
+    """
+    messages = []
+    sink_id = logger.add(
+        lambda message: messages.append((message.record["level"].name, message.record["message"])),
+        level="DEBUG",
+    )
+    try:
+        result = process_file(file_path, sheet_name)
+    finally:
+        logger.remove(sink_id)
+
+    return result, messages
 
 
 # Função para orquestrar o processamento de múltiplos arquivos de orçamento
@@ -912,42 +1548,14 @@ def orchestrate_budget_reader(
     """
     all_tables = []  # Lista para armazenar todas as tabelas processadas
     all_metadata = []  # Lista para armazenar todos os metadados processados
+    df_all_tables, df_all_metadatas = None, None
 
-    def process_file(file_path: str, sheet_name: Optional[str] = None):
-        """
-        Processa um único arquivo e adiciona os resultados às listas.
-
-        Args:
-            file_path (str): Caminho do arquivo.
-            sheet_name (Optional[str]): Nome da aba a ser lida.
-        """
-
-        print("-" * 50)
-        logger.info(f"Iniciando o processamento do arquivo: {file_path}")
-
-        # Lê a tabela de orçamento do arquivo
-        table, sheet_name, metadata = read_budget_table(file_path=file_path, sheet_name=sheet_name)
-
-        if isinstance(table, pd.DataFrame):
-
-            # Adiciona os resultados às listas
-            append_data(all_tables, all_metadata, FileInput(file_path, sheet_name), table, metadata)
-
-            # Loga o sucesso no processamento do arquivo
-            logger.success(f"Processamento concluído para o arquivo: {file_path}")
-
-            return True
-
-        else:
-            # Loga a falha no processamento do arquivo
-            logger.error(f"Falha ao processar o arquivo: {file_path}")
-
-            return False
-
+    # Expande os inputs em uma lista única de arquivos (caminho, aba)
+    files_to_process = []
     for input_item in inputs:
         if isinstance(input_item, FileInput):
             # Processa um único arquivo
-            _ = process_file(file_path=input_item.file_path, sheet_name=input_item.sheet_name)
+            files_to_process.append((input_item.file_path, input_item.sheet_name))
         elif isinstance(input_item, (str, Path)):
             # Processa todos os arquivos em um diretório
             files = get_files_from_directory(
@@ -960,8 +1568,47 @@ def orchestrate_budget_reader(
 
             logger.info(f"{len(files)} arquivos encontrados no diretório: {input_item}")
 
-            for file_path in files:
-                _ = process_file(file_path=str(file_path))
+            files_to_process.extend((str(file_path), None) for file_path in files)
+
+    if files_to_process:
+        file_paths, sheet_names = zip(*files_to_process)
+
+        # Não cria mais processos do que arquivos (nem do que o limite configurado)
+        max_workers = min(len(file_paths), MAX_WORKERS or os.cpu_count() or 1)
+
+        if max_workers > 1:
+            # Os arquivos são independentes: processa cada um em um processo separado
+            # Os logs de cada processo são devolvidos e emitidos aqui, no processo principal
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker_logger
+            ) as executor:
+                worker_results = list(
+                    executor.map(_process_file_in_worker, file_paths, sheet_names)
+                )
+
+            results = []
+            for result, messages in worker_results:
+                for level, message in messages:
+                    logger.log(level, message)
+                results.append(result)
+        else:
+            # Um único arquivo (ou worker): evita o custo de criar o pool de processos
+            results = [process_file(path, sheet) for path, sheet in zip(file_paths, sheet_names)]
+
+        # Consolida os resultados no processo principal, mantendo a ordem dos arquivos
+        for file_path, result in zip(file_paths, results):
+            if result is None:
+                # Loga a falha no processamento do arquivo
+                logger.error(f"Falha ao processar o arquivo: {file_path}")
+                continue
+
+            table, metadata, file_path, sheet_name = result
+
+            # Adiciona os resultados às listas
+            append_data(all_tables, all_metadata, FileInput(file_path, sheet_name), table, metadata)
+
+            # Loga o sucesso no processamento do arquivo
+            logger.success(f"Processamento concluído para o arquivo: {file_path}")
 
     # Verifica se há tabelas processadas
     if all_tables:
@@ -974,9 +1621,7 @@ def orchestrate_budget_reader(
             all_tables=all_tables,
             all_metadatas=all_metadata,
             output_path=Path(base_dir, DIR_OUTPUTS),
-            output_file=settings.get(
-                "default_budget_reader.result.file_name_output", "budget_reader_output.xlsx"
-            ),
+            output_file=FILE_NAME_OUTPUT,
         )
 
     # Retorna os dados consolidados
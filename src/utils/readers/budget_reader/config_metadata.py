@@ -3,168 +3,221 @@ pattern: # Padrão a ser buscado
 method: # Método: "iterate", "limited_iterate", ou "specific_cell"
 max_rows: # Número máximo de linhas para iterar (apenas para "limited_iterate")
 specific_cell: # Coordenadas da célula específica (linha, coluna) para "specific_cell"
+
+As coordenadas são posições (base 0) na aba lida uma única vez, sem cabeçalho, e convertida
+para um array NumPy (leitura com calamine ou openpyxl em modo read_only); as linhas totalmente
+em branco da aba principal não são contadas. A busca é feita por indexação nesse array, e não
+por acessos célula a célula à planilha (ws.cell(linha, coluna)).
 """
 
+from types import MappingProxyType
+
+# Campos aceitos na configuração de cada metadado
+METADATA_FIELDS = frozenset(
+    {"sheet_name", "pattern", "method", "max_rows", "specific_cell", "type"}
+)
+
+
+# Função para congelar recursivamente um dicionário em mapeamentos somente leitura
+def _freeze(mapping: dict) -> MappingProxyType:
+    """Converte recursivamente dicionários em MappingProxyType (somente leitura)."""
+    return MappingProxyType(
+        {
+            key: _freeze(value) if isinstance(value, dict) else value
+            for key, value in mapping.items()
+        }
+    )
+
+
+# Metadados padrão ajustados
+_METADATA_KEYS = {
+    "default01": {
+        "CÓDIGO_UPE": {
+            "sheet_name": "LPU",
+            "pattern": "UPE",
+            "method": "iterate",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "int",
+        },
+        "NUMERO_AGENCIA": {
+            "sheet_name": "LPU",
+            "pattern": "AGENCIA",
+            "method": "iterate",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "int",
+        },
+        "NOME_AGENCIA": {
+            "sheet_name": "LPU",
+            "pattern": "NOME AGENCIA",
+            "method": "iterate",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+        "CONSTRUTORA": {
+            "sheet_name": "LPU",
+            "pattern": "CONSTRUTORA",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (1, 0),
+            "type": "str",
+        },
+        "TIPO": {
+            "sheet_name": "LPU",
+            "pattern": "TIPO",
+            "method": "iterate",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+        "PROGRAMA_DONO": {
+            "sheet_name": "LPU",
+            "pattern": "DONO",
+            "method": "iterate",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+    },
+    "default02": {
+        "CÓDIGO_UPE": {
+            "sheet_name": "Resumo",
+            "pattern": "UPE",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (4, 11),
+            "type": "int",
+        },
+        "NUMERO_AGENCIA": {
+            "sheet_name": "Resumo",
+            "pattern": "AGENCIA",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (4, 1),
+            "type": "int",
+        },
+        "NOME_AGENCIA": {
+            "sheet_name": "Resumo",
+            "pattern": "NOME AGENCIA",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (5, 1),
+            "type": "str",
+        },
+        "CONSTRUTORA": {
+            "sheet_name": "Resumo",
+            "pattern": "CONSTRUTORA",
+            "method": None,
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+        "TIPO": {
+            "sheet_name": "Resumo",
+            "pattern": "TIPO",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (6, 1),
+            "type": "str",
+        },
+        "PROGRAMA_DONO": {
+            "sheet_name": "01",
+            "pattern": "DONO",
+            "method": None,
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+    },
+    "default03": {
+        "CÓDIGO_UPE": {
+            "sheet_name": "Resumo",
+            "pattern": "UPE",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+        "NUMERO_AGENCIA": {
+            "sheet_name": "Resumo",
+            "pattern": "AGENCIA",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (4, 1),
+            "type": "int",
+        },
+        "NOME_AGENCIA": {
+            "sheet_name": "Resumo",
+            "pattern": "NOME AGENCIA",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (5, 1),
+            "type": "str",
+        },
+        "CONSTRUTORA": {
+            "sheet_name": "Resumo",
+            "pattern": "CONSTRUTORA",
+            "method": None,
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+        "TIPO": {
+            "sheet_name": "Resumo",
+            "pattern": "TIPO",
+            "method": "specific_cell",
+            "max_rows": None,
+            "specific_cell": (6, 1),
+            "type": "str",
+        },
+        "PROGRAMA_DONO": {
+            "sheet_name": "01",
+            "pattern": "DONO",
+            "method": None,
+            "max_rows": None,
+            "specific_cell": None,
+            "type": "str",
+        },
+    },
+}
+
+
+# Função para validar os campos das configurações de metadados
+def _validate_fields(metadata_keys: dict) -> dict:
+    """
+    Garante que as configurações usem apenas METADATA_FIELDS (e.g., evita "soecific_cell").
+
+    Args:
+        metadata_keys (dict): Metadados por padrão de cabeçalho.
+
+    Returns:
+        dict: Os mesmos metadados, validados.
+
+    Raises:
+        ValueError: Se alguma configuração tiver um campo desconhecido.
+    """
+    for pattern_key, keys in metadata_keys.items():
+        for key, config in keys.items():
+            unknown_fields = set(config) - METADATA_FIELDS
+            if unknown_fields:
+                raise ValueError(
+                    f"Campos desconhecidos no metadado '{key}' do padrão '{pattern_key}': "
+                    f"{sorted(unknown_fields)}. Campos aceitos: {sorted(METADATA_FIELDS)}."
+                )
+    return metadata_keys
+
+
+# Metadados padrão, construídos uma única vez na carga do módulo (somente leitura)
+_DEFAULT_METADATA_KEYS = _freeze(_validate_fields(_METADATA_KEYS))
+
 
 def get_metadata_keys():
     """Retorna as chaves de metadados padrão para leitura de orçamentos.
 
     Returns:
-        dict: Dicionário contendo as chaves de metadados padrão.
+        MappingProxyType: Mapeamento somente leitura contendo as chaves de metadados padrão.
     """
 
-    # Metadados padrão ajustados
-    DEFAULT_METADATA_KEYS = {
-        "default01": {
-            "CÓDIGO_UPE": {
-                "sheet_name": "LPU",
-                "pattern": "UPE",
-                "method": "iterate",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "int",
-            },
-            "NUMERO_AGENCIA": {
-                "sheet_name": "LPU",
-                "pattern": "AGENCIA",
-                "method": "iterate",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "int",
-            },
-            "NOME_AGENCIA": {
-                "sheet_name": "LPU",
-                "pattern": "NOME AGENCIA",
-                "method": "iterate",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-            "CONSTRUTORA": {
-                "sheet_name": "LPU",
-                "pattern": "CONSTRUTORA",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (1, 0),
-                "type": "str",
-            },
-            "TIPO": {
-                "sheet_name": "LPU",
-                "pattern": "TIPO",
-                "method": "iterate",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-            "PROGRAMA_DONO": {
-                "sheet_name": "LPU",
-                "pattern": "DONO",
-                "method": "iterate",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-        },
-        "default02": {
-            "CÓDIGO_UPE": {
-                "sheet_name": "Resumo",
-                "pattern": "UPE",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (4, 11),
-                "type": "int",
-            },
-            "NUMERO_AGENCIA": {
-                "sheet_name": "Resumo",
-                "pattern": "AGENCIA",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (4, 1),
-                "type": "int",
-            },
-            "NOME_AGENCIA": {
-                "sheet_name": "Resumo",
-                "pattern": "NOME AGENCIA",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (5, 1),
-                "type": "str",
-            },
-            "CONSTRUTORA": {
-                "sheet_name": "Resumo",
-                "pattern": "CONSTRUTORA",
-                "method": None,
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-            "TIPO": {
-                "sheet_name": "Resumo",
-                "pattern": "TIPO",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (6, 1),
-                "type": "str",
-            },
-            "PROGRAMA_DONO": {
-                "sheet_name": "01",
-                "pattern": "DONO",
-                "method": None,
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-        },
-        "default03": {
-            "CÓDIGO_UPE": {
-                "sheet_name": "Resumo",
-                "pattern": "UPE",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-            "NUMERO_AGENCIA": {
-                "sheet_name": "Resumo",
-                "pattern": "AGENCIA",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (4, 1),
-                "type": "int",
-            },
-            "NOME_AGENCIA": {
-                "sheet_name": "Resumo",
-                "pattern": "NOME AGENCIA",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (5, 1),
-                "type": "str",
-            },
-            "CONSTRUTORA": {
-                "sheet_name": "Resumo",
-                "pattern": "CONSTRUTORA",
-                "method": None,
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-            "TIPO": {
-                "sheet_name": "Resumo",
-                "pattern": "TIPO",
-                "method": "specific_cell",
-                "max_rows": None,
-                "specific_cell": (6, 1),
-                "type": "str",
-            },
-            "PROGRAMA_DONO": {
-                "sheet_name": "01",
-                "pattern": "DONO",
-                "method": None,
-                "max_rows": None,
-                "specific_cell": None,
-                "type": "str",
-            },
-        },
-    }
-
-    return DEFAULT_METADATA_KEYS
+    return _DEFAULT_METADATA_KEYS
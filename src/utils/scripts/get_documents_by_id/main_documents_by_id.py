@@ -2,8 +2,7 @@ import sys
 from pathlib import Path
 
 import pandas as pd
-
-sys.path.append(Path(__file__).parents[0])
+from loguru import logger
 
 from modules.synthetic_data import make_synthetic_upe_dataset
 from modules.get_documents_by_id import orchestra_pick_row_by_date
@@ -37,6 +36,19 @@ def orchestra_generate_final_dataframe(df):
     return df_result
 
 
+def configure_logger(level: str = "INFO") -> None:
+    """
+    Configura o logger do script, exibindo no console apenas mensagens a partir do nível informado.
+
+    Os logs de depuração de pick_row (que formatam DataFrames inteiros) ficam desativados por padrão.
+
+    Args:
+        level (str): Nível mínimo das mensagens exibidas.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=level)
+
+
 def main():
     """
     Função principal para demonstrar o uso do script.
@@ -45,24 +57,27 @@ def main():
     processar colunas de data e realizar operações adicionais conforme necessário.
     """
 
+    # Configura o logger (sem os logs de depuração por padrão)
+    configure_logger()
+
     # Diretório atual
     current_dir = Path(__file__).parents[0]
 
     # Gera o conjunto de dados sintético
     df = make_synthetic_upe_dataset(n_upe=20, rows_per_upe=(3, 6), seed=7)
 
-    # Salva o conjunto de dados gerado para análise
-    generated_file = current_dir / "dados_gerados.xlsx"
-    df.to_excel(generated_file, index=False)
-    print(f"Conjunto de dados gerado salvo em '{generated_file}'.")
+    # Salva o conjunto de dados gerado para análise (CSV: escrita muito mais rápida que xlsx)
+    generated_file = current_dir / "dados_gerados.csv"
+    df.to_csv(generated_file, index=False)
+    logger.info(f"Conjunto de dados gerado salvo em '{generated_file}'.")
 
     # Orquestra a obtenção dos dados
     df_result = orchestra_generate_final_dataframe(df=df)
 
     # Salva o DataFrame final para análise
-    final_file = current_dir / "dados_finais.xlsx"
-    df_result.to_excel(final_file, index=False)
-    print(f"DataFrame final salvo em '{final_file}'.")
+    final_file = current_dir / "dados_finais.csv"
+    df_result.to_csv(final_file, index=False)
+    logger.info(f"DataFrame final salvo em '{final_file}'.")
 
 
 if __name__ == "__main__":
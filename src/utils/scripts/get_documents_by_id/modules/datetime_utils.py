@@ -11,6 +11,10 @@ def ensure_datetime(series: pd.Series) -> pd.Series:
     Returns:
         pd.Series: The converted Series with datetime values.
     """
+    # Columns that are already datetime are returned as is (no new parsing pass)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
     return pd.to_datetime(series, errors="coerce")
 
 
@@ -25,7 +29,12 @@ def preprocess_datetime_columns(df: pd.DataFrame, columns: list[str]) -> pd.Data
     Returns:
         pd.DataFrame: The DataFrame with datetime columns processed.
     """
-    for col in columns:
-        if col in df.columns:
-            df[col] = ensure_datetime(df[col])
+    # Resolve once which columns still need conversion (already-datetime columns are skipped)
+    columns_to_convert = [
+        col
+        for col in columns
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+    ]
+    for col in columns_to_convert:
+        df[col] = ensure_datetime(df[col])
     return df
@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
-
 import pandas as pd
 
-sys.path.append(Path(__file__).parents[0])
-
-from modules.pick_row_by_date import pick_row
+from .datetime_utils import preprocess_datetime_columns
+from .pick_row_by_date import pick_rows_by_group
 
 
 def orchestra_pick_row_by_date(
@@ -36,47 +32,23 @@ def orchestra_pick_row_by_date(
     Returns:
         pd.DataFrame: DataFrame final com as colunas selecionadas e a estratégia usada.
     """
-    selected_rows = []
-
-    # Itera sobre cada UPE único no DataFrame
-    for upe in df[upe_col].unique():
-        try:
-            # Filtra o DataFrame para o UPE atual
-            filtered_df = df[df[upe_col] == upe]
-
-            print(f"UPE atual: {upe}")
-
-            # Itera pelas estratégias para encontrar a linha válida
-            for strat in strategy:
-                try:
-                    selected_row = pick_row(
-                        filtered_df,
-                        strategy=[strat],
-                        strict=strict,
-                        prefer=prefer_col,
-                        start_col=start_col,
-                        end_col=end_col,
-                        between_preference=between_preference,
-                    )
-
-                    # Adiciona a estratégia usada na linha selecionada
-                    selected_row = selected_row.to_dict()
-                    selected_row["STRATEGY_USED"] = strat
-                    selected_rows.append(selected_row)
-                    break
-
-                except ValueError:
-                    continue
-
-        except ValueError as e:
-            print(f"Erro ao processar UPE {upe}: {e}")
-
-    # Cria um DataFrame com as linhas selecionadas
-    final_df = pd.DataFrame(selected_rows)
-
-    # Remove duplicatas por UPE, mantendo a linha com a DATA_INCLUSAO_DOC mais recente
-    final_df = final_df.sort_values(date_col, ascending=False).drop_duplicates(
-        subset=upe_col, keep="first"
+    # Converte as colunas de data uma única vez, antes da seleção das linhas
+    df = preprocess_datetime_columns(df.copy(), [prefer_col, start_col, end_col])
+
+    # Seleciona, de forma vetorizada, uma linha por UPE (uma ordenação por estratégia)
+    final_df = pick_rows_by_group(
+        df,
+        group_col=upe_col,
+        strategy=strategy,
+        strict=strict,
+        prefer=prefer_col,
+        start_col=start_col,
+        end_col=end_col,
+        between_preference=between_preference,
     )
 
+    # pick_rows_by_group já retorna uma única linha por UPE; ordena da DATA_INCLUSAO_DOC
+    # mais recente para a mais antiga apenas para apresentação
+    final_df = final_df.sort_values(date_col, ascending=False)
+
     return final_df
@@ -1,12 +1,33 @@
-import sys
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
+from loguru import logger
+
+
+def distance_to_interval_days(
+    inclusion: np.ndarray, start: np.ndarray, end: np.ndarray
+) -> np.ndarray:
+    """
+    Calcula, em dias inteiros, a distância de cada data ao intervalo [start, end].
+
+    A conta é feita diretamente sobre arrays datetime64 (sem Series intermediárias), com o
+    mesmo arredondamento de Series.dt.days. Datas dentro do intervalo ou nulas têm distância 0.
+
+    Args:
+        inclusion (np.ndarray): Datas a serem comparadas com o intervalo (datetime64).
+        start (np.ndarray): Datas de início do intervalo (datetime64).
+        end (np.ndarray): Datas de fim do intervalo (datetime64).
+
+    Returns:
+        np.ndarray: Distância, em dias, de cada data ao intervalo.
+    """
+    one_day = np.timedelta64(1, "D")
 
-sys.path.append(Path(__file__).parents[0])
+    # Posições com NaT não são selecionadas pelo np.where; ignora o aviso da divisão
+    with np.errstate(invalid="ignore"):
+        days_before = (start - inclusion) // one_day  # Antes do intervalo
+        days_after = (inclusion - end) // one_day  # Depois do intervalo
 
-from modules.datetime_utils import preprocess_datetime_columns
+    return np.where(inclusion < start, days_before, np.where(inclusion > end, days_after, 0))
 
 
 def pick_row(
@@ -22,8 +43,11 @@ def pick_row(
     """
     Seleciona uma linha de um DataFrame com base na estratégia fornecida e retorna a linha com a DATA_INCLUSAO_DOC mais próxima do intervalo.
 
+    As colunas prefer, start_col e end_col devem estar convertidas para datetime
+    (ver preprocess_datetime_columns), o que é feito uma única vez pelo chamador.
+
     Args:
-        df (pd.DataFrame): DataFrame já filtrado para o contexto desejado.
+        df (pd.DataFrame): DataFrame já filtrado para o contexto desejado, com as colunas de data em datetime.
         strategy (list[str]): Lista de estratégias em ordem de prioridade.
         strategy_options (list[str]): Estratégias permitidas para validação.
         strict (bool): Se True, aplica rigorosamente a lista de estratégias.
@@ -33,16 +57,13 @@ def pick_row(
         between_preference (str): Define se seleciona a primeira ('first') ou última ('last') linha para a estratégia 'between'.
 
     Returns:
-        pd.Series: Linha selecionada do DataFrame.
+        pd.Series: Linha selecionada do DataFrame. A estratégia que selecionou a linha é
+                   registrada em attrs["strategy_used"].
 
     Raises:
         ValueError: Se nenhuma linha válida for encontrada no modo estrito.
     """
-    # Preprocess datetime columns to ensure resilience
-    df = preprocess_datetime_columns(df, [prefer, start_col, end_col])
-
-    print("\nIniciando pick_row com as seguintes estratégias:", strategy)
-    print("-" * 50)
+    logger.debug(f"Iniciando pick_row com as seguintes estratégias: {strategy}")
 
     # Valida as opções de estratégia
     for strat in strategy:
@@ -51,38 +72,39 @@ def pick_row(
                 f"Estratégia inválida: {strat}. Estratégias permitidas são {strategy_options}."
             )
 
-    print("DataFrame recebido:")
-    print(df)
-    print("-" * 50)
+    # DataFrames são formatados apenas se houver um destino de log no nível DEBUG
+    logger.opt(lazy=True).debug("DataFrame recebido:\n{}", lambda: df)
 
     # Define a lista de estratégias a ser usada
     strategies_to_use = (
         strategy if strict else strategy + [s for s in strategy_options if s not in strategy]
     )
-    print("Estratégias a serem usadas:", strategies_to_use)
-    print("-" * 50)
+    logger.debug(f"Estratégias a serem usadas: {strategies_to_use}")
+
+    # Colunas de data obtidas uma única vez e reaproveitadas pelas estratégias
+    inclusion = df[prefer].to_numpy()
+    start = df[start_col].to_numpy()
+    end = df[end_col].to_numpy()
 
     # Itera pela lista de estratégias em ordem de prioridade
     for strat in strategies_to_use:
-        print(f"Avaliando estratégia: {strat}")
-        print("-" * 50)
+        logger.debug(f"Avaliando estratégia: {strat}")
 
         if strat == "last":
             # Ordena pela coluna preferida e retorna a última linha
             selected_row = df.sort_values(prefer).iloc[-1]
-            print("Estratégia 'last' selecionou a seguinte linha:")
-            print(selected_row)
-            print("-" * 50)
+            logger.opt(lazy=True).debug(
+                "Estratégia 'last' selecionou a seguinte linha:\n{}", lambda: selected_row
+            )
+            selected_row.attrs["strategy_used"] = strat
             return selected_row
 
         if strat in ["between", "between_else_nearest"]:
             # Identifica linhas onde DATA_INCLUSAO_DOC está dentro do intervalo
-            between_mask = (df[start_col] <= df[prefer]) & (df[prefer] <= df[end_col])
+            between_mask = (start <= inclusion) & (inclusion <= end)
             candidates = df[between_mask]
 
-            print("Linhas candidatas para 'between':")
-            print(candidates)
-            print("-" * 50)
+            logger.opt(lazy=True).debug("Linhas candidatas para 'between':\n{}", lambda: candidates)
 
             if not candidates.empty:
                 # Retorna a linha com base na preferência ('first' ou 'last')
@@ -91,9 +113,12 @@ def pick_row(
                 else:  # Default to 'last'
                     selected_row = candidates.sort_values(prefer).iloc[-1]
 
-                print(f"Estratégia 'between' selecionou a seguinte linha ({between_preference}):")
-                print(selected_row)
-                print("-" * 50)
+                logger.opt(lazy=True).debug(
+                    "Estratégia 'between' selecionou a seguinte linha ({}):\n{}",
+                    lambda: between_preference,
+                    lambda: selected_row,
+                )
+                selected_row.attrs["strategy_used"] = strat
                 return selected_row
 
             if strat == "between":
@@ -103,38 +128,117 @@ def pick_row(
 
         if strat in ["nearest", "between_else_nearest"]:
             # Calcula a distância para o intervalo de cada linha
-            start = df[start_col]
-            end = df[end_col]
-            inclusion = df[prefer]
-
-            dist = np.where(
-                inclusion < start,
-                (
-                    start - inclusion
-                ).dt.days,  # Distância se DATA_INCLUSAO_DOC for antes do intervalo
-                np.where(
-                    inclusion > end, (inclusion - end).dt.days, 0
-                ),  # Distância se for depois do intervalo
-            )
-            df["_dist_days"] = dist
+            dist = distance_to_interval_days(inclusion, start, end)
 
-            print("Distâncias calculadas para 'nearest':")
-            print(df[[prefer, start_col, end_col, "_dist_days"]])
-            print("-" * 50)
+            logger.opt(lazy=True).debug(
+                "Distâncias calculadas para 'nearest':\n{}",
+                lambda: df[[prefer, start_col, end_col]].assign(_dist_days=dist),
+            )
 
-            # Ordena pela distância e pela coluna preferida, então retorna a linha mais próxima
-            df = df.sort_values(["_dist_days", prefer], ascending=[True, True])
-            best = df.iloc[0]
-            print("Estratégia 'nearest' selecionou a seguinte linha:")
-            print(best)
-            print("-" * 50)
-            return best.drop(labels=["_dist_days"])
+            # Ordena pela distância e pela coluna preferida (NaT por último) sem alterar o
+            # DataFrame, então retorna a linha mais próxima
+            order = np.lexsort((inclusion, dist))
+            best = df.iloc[order[0]]
+            logger.opt(lazy=True).debug(
+                "Estratégia 'nearest' selecionou a seguinte linha:\n{}", lambda: best
+            )
+            best.attrs["strategy_used"] = strat
+            return best
 
     # Se nenhuma linha válida for encontrada e o modo estrito estiver ativado, levanta um erro
     if strict:
         raise ValueError("Nenhuma linha válida encontrada para as estratégias fornecidas.")
 
     # Comportamento padrão: retorna uma Series vazia se nenhuma linha for encontrada
-    print("Nenhuma linha válida encontrada. Retornando Series vazia.")
-    print("-" * 50)
+    logger.debug("Nenhuma linha válida encontrada. Retornando Series vazia.")
     return pd.Series()
+
+
+def pick_rows_by_group(
+    df: pd.DataFrame,
+    group_col: str,
+    strategy: list[str] = ["between_else_nearest"],
+    strategy_options: list[str] = ["between", "nearest", "last", "between_else_nearest"],
+    strict: bool = False,
+    prefer: str = "DATA_INCLUSAO_DOC",
+    start_col: str = "DATA_INICIO_REAL",
+    end_col: str = "DATA_FIM_REAL",
+    between_preference: str = "last",
+) -> pd.DataFrame:
+    """
+    Versão vetorizada de pick_row: seleciona uma linha por grupo (e.g., UPE) com as mesmas
+    estratégias, usando uma ordenação por estratégia sobre o DataFrame inteiro em vez de
+    filtrar e ordenar cada grupo separadamente. Assim como em pick_row, as colunas de data
+    devem estar convertidas para datetime.
+
+    Args:
+        df (pd.DataFrame): DataFrame com todos os grupos, com as colunas de data em datetime.
+        group_col (str): Nome da coluna que identifica os grupos.
+        strategy (list[str]): Lista de estratégias em ordem de prioridade.
+        strategy_options (list[str]): Estratégias permitidas para validação.
+        strict (bool): Se True, aplica apenas a lista de estratégias fornecida.
+        prefer (str): Coluna preferida para desempate ou ordenação.
+        start_col (str): Nome da coluna para a data de início.
+        end_col (str): Nome da coluna para a data de fim.
+        between_preference (str): Define se seleciona a primeira ('first') ou última ('last') linha para a estratégia 'between'.
+
+    Returns:
+        pd.DataFrame: Uma linha por grupo, com a coluna STRATEGY_USED indicando a estratégia
+                      que selecionou a linha. Grupos sem linha válida não são retornados.
+    """
+    # Valida as opções de estratégia
+    for strat in strategy:
+        if strat not in strategy_options:
+            raise ValueError(
+                f"Estratégia inválida: {strat}. Estratégias permitidas são {strategy_options}."
+            )
+
+    # Define a lista de estratégias a ser usada
+    strategies_to_use = (
+        strategy if strict else strategy + [s for s in strategy_options if s not in strategy]
+    )
+
+    # Desconsidera as linhas sem grupo
+    df = df[df[group_col].notna()]
+
+    # Máscara 'between' e distância ao intervalo calculadas uma única vez para todas as linhas
+    inclusion = df[prefer].to_numpy()
+    start = df[start_col].to_numpy()
+    end = df[end_col].to_numpy()
+    between_mask = (start <= inclusion) & (inclusion <= end)
+    dist = distance_to_interval_days(inclusion, start, end)
+
+    selected = []
+    pending = np.ones(len(df), dtype=bool)  # Linhas dos grupos ainda sem seleção
+
+    # Itera pela lista de estratégias em ordem de prioridade
+    for strat in strategies_to_use:
+        if not pending.any():
+            break
+
+        steps = []
+        if strat == "last":
+            steps.append(("last", pending, [prefer], "last"))
+        if strat in ["between", "between_else_nearest"]:
+            steps.append(("between", pending & between_mask, [prefer], between_preference))
+        if strat in ["nearest", "between_else_nearest"]:
+            steps.append(("nearest", pending, ["_dist_days", prefer], "first"))
+
+        for step, mask, sort_cols, keep in steps:
+            # Os grupos resolvidos por uma etapa anterior desta estratégia são ignorados
+            mask = mask & pending
+            if not mask.any():
+                continue
+
+            # Ordena as candidatas de todos os grupos de uma vez e mantém uma linha por grupo
+            candidates = df[mask].assign(_dist_days=dist[mask])
+            chosen = candidates.sort_values(sort_cols, kind="stable").drop_duplicates(
+                subset=group_col, keep=keep
+            )
+            selected.append(chosen.drop(columns="_dist_days").assign(STRATEGY_USED=strat))
+            pending &= ~df[group_col].isin(chosen[group_col]).to_numpy()
+
+    if not selected:
+        return df.iloc[0:0].assign(STRATEGY_USED=pd.Series(dtype=object))
+
+    return pd.concat(selected)
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import numpy as np
 import pandas as pd
 
@@ -17,6 +19,7 @@ def make_synthetic_upe_dataset(
 
     Returns:
         pd.DataFrame: Conjunto de dados sintético com as colunas DOCUMENTO, UPE, DATA_INCLUSAO_DOC, etc.
+                      FORNECEDOR é categórica (cada nome é armazenado uma única vez).
     """
     rng = np.random.default_rng(seed)
 
@@ -36,63 +39,145 @@ def make_synthetic_upe_dataset(
         "ELLO COSTA LIMA",
     ]
 
-    rows = []
-    doc_id = 400000
-
-    for upe in base_upe:
-        k = int(rng.integers(rows_per_upe[0], rows_per_upe[1] + 1))
-        start = pd.Timestamp("2024-01-01") + pd.Timedelta(days=int(rng.integers(0, 500)))
-        duration_days = int(rng.integers(10, 120))
-        end = start + pd.Timedelta(days=duration_days)
-
-        for _ in range(k):
-            inclusion_offset = int(rng.integers(-15, 45))
-            inclusion = (
-                start
-                + pd.Timedelta(days=inclusion_offset)
-                + pd.Timedelta(
-                    hours=int(rng.integers(0, 24)),
-                    minutes=int(rng.integers(0, 60)),
-                    seconds=int(rng.integers(0, 60)),
-                )
-            )
-
-            # Introduce poorly formatted dates and null values
-            if rng.random() < 0.2:  # 20% chance to introduce a poorly formatted date
-                inclusion = inclusion.strftime("%Y/%m/%d %H:%M:%S") if rng.random() < 0.5 else None
-            elif rng.random() < 0.1:  # 10% chance to introduce a completely invalid date
-                inclusion = "invalid_date"
-
-            # Add rows for various strategies
-            rows.append(
-                {
-                    "DOCUMENTO": doc_id,
-                    "UPE": int(upe),
-                    "DATA_INCLUSAO_DOC": inclusion,
-                    "DATA_INICIO_REAL": start.normalize(),
-                    "DATA_FIM_REAL": end.normalize(),
-                    "FORNECEDOR": rng.choice(fornecedores),
-                }
-            )
-
-            # Add rows outside the 'between' range for 'nearest' strategy
-            if rng.random() < 0.3:  # 30% chance to add an out-of-range row
-                out_of_range_date = end + pd.Timedelta(days=int(rng.integers(1, 30)))
-                rows.append(
-                    {
-                        "DOCUMENTO": doc_id + 1,
-                        "UPE": int(upe),
-                        "DATA_INCLUSAO_DOC": out_of_range_date,
-                        "DATA_INICIO_REAL": start.normalize(),
-                        "DATA_FIM_REAL": end.normalize(),
-                        "FORNECEDOR": rng.choice(fornecedores),
-                    }
-                )
-
-            doc_id += int(rng.integers(1, 80))
-
-    df = pd.DataFrame(rows)
-    df = df.sort_values(
-        ["UPE", "DATA_INICIO_REAL", "DATA_INCLUSAO_DOC"], na_position="first"
-    ).reset_index(drop=True)
+    # Sorteia, de uma só vez, o número de linhas, o início e a duração de cada UPE
+    k = rng.integers(rows_per_upe[0], rows_per_upe[1] + 1, size=n_upe)
+    starts = np.datetime64("2024-01-01", "D") + rng.integers(0, 500, size=n_upe).astype(
+        "timedelta64[D]"
+    )
+    ends = starts + rng.integers(10, 120, size=n_upe).astype("timedelta64[D]")
+
+    # Expande os atributos de cada UPE para as suas linhas
+    total_rows = int(k.sum())
+    upe_rows = np.repeat(base_upe, k)
+    start_rows = np.repeat(starts, k)
+    end_rows = np.repeat(ends, k)
+
+    # Data de inclusão: início + deslocamento em dias + horas, minutos e segundos aleatórios
+    offset_seconds = (
+        rng.integers(-15, 45, size=total_rows) * 86400
+        + rng.integers(0, 24, size=total_rows) * 3600
+        + rng.integers(0, 60, size=total_rows) * 60
+        + rng.integers(0, 60, size=total_rows)
+    )
+    inclusion = start_rows.astype("datetime64[s]") + offset_seconds.astype("timedelta64[s]")
+    inclusion_col = pd.Series(inclusion.astype("datetime64[ns]")).astype(object)
+
+    # Introduce poorly formatted dates and null values
+    # Um único sorteio por linha: 10% texto, 10% nulo e 8% data inválida (10% das 80% restantes)
+    bad_date_draw = rng.random(total_rows)
+    to_string = bad_date_draw < 0.1
+    to_null = (bad_date_draw >= 0.1) & (bad_date_draw < 0.2)
+    invalid = (bad_date_draw >= 0.2) & (bad_date_draw < 0.28)
+    inclusion_col[to_string] = (
+        pd.Series(inclusion[to_string]).dt.strftime("%Y/%m/%d %H:%M:%S").to_numpy()
+    )
+    inclusion_col[to_null] = None
+    inclusion_col[invalid] = "invalid_date"
+
+    # Identificadores dos documentos em ordem crescente, com saltos aleatórios
+    doc_ids = 400000 + np.cumsum(
+        np.concatenate(([0], rng.integers(1, 80, size=max(total_rows - 1, 0))))
+    )[:total_rows].astype(np.int64)
+
+    # Add rows outside the 'between' range for 'nearest' strategy
+    fornecedor_codes = rng.integers(0, len(fornecedores), size=total_rows)
+    out_of_range = rng.random(total_rows) < 0.3  # 30% chance to add an out-of-range row
+    n_out_of_range = int(out_of_range.sum())
+    out_of_range_inclusion = (
+        end_rows[out_of_range] + rng.integers(1, 30, size=n_out_of_range).astype("timedelta64[D]")
+    ).astype("datetime64[ns]")
+
+    # Junta as linhas base e as fora do intervalo em arrays tipados; a linha extra reaproveita
+    # UPE, janela planejada e fornecedor da linha que a originou
+    upe_all = np.concatenate((upe_rows, upe_rows[out_of_range])).astype(np.int64)
+    start_all = np.concatenate((start_rows, start_rows[out_of_range])).astype("datetime64[ns]")
+    end_all = np.concatenate((end_rows, end_rows[out_of_range])).astype("datetime64[ns]")
+    doc_all = np.concatenate((doc_ids, doc_ids[out_of_range] + 1))
+    codes_all = np.concatenate((fornecedor_codes, fornecedor_codes[out_of_range]))
+    inclusion_all = np.concatenate(
+        (
+            inclusion_col.to_numpy(),
+            pd.Series(out_of_range_inclusion).astype(object).to_numpy(),
+        )
+    )
+
+    # Chaves de ordenação da data de inclusão: nulos primeiro, depois datas e por fim textos
+    is_string = np.concatenate((to_string | invalid, np.zeros(n_out_of_range, dtype=bool)))
+    is_null = np.concatenate((to_null, np.zeros(n_out_of_range, dtype=bool)))
+    inclusion_kind = np.where(is_null, 0, np.where(is_string, 2, 1))
+    inclusion_ns = np.concatenate((inclusion.astype("datetime64[ns]"), out_of_range_inclusion))
+    inclusion_ns = np.where(inclusion_kind == 1, inclusion_ns.view(np.int64), 0)
+    string_rank = np.zeros(len(inclusion_all), dtype=np.int64)
+    string_rank[is_string] = np.unique(inclusion_all[is_string].astype(str), return_inverse=True)[1]
+
+    # Cada linha fora do intervalo fica logo após a linha que a originou
+    position = np.concatenate((np.arange(total_rows) * 2, np.flatnonzero(out_of_range) * 2 + 1))
+    order = np.lexsort(
+        (
+            position,
+            string_rank,
+            inclusion_ns,
+            inclusion_kind,
+            start_all.view(np.int64),
+            upe_all,
+        )
+    )
+
+    df = pd.DataFrame(
+        {
+            "DOCUMENTO": doc_all[order],
+            "UPE": upe_all[order],
+            "DATA_INCLUSAO_DOC": pd.Series(inclusion_all[order], dtype=object),
+            "DATA_INICIO_REAL": start_all[order],
+            "DATA_FIM_REAL": end_all[order],
+            "FORNECEDOR": pd.Categorical.from_codes(codes_all[order], categories=fornecedores),
+        },
+        copy=False,
+    )
     return df
+
+
+def iter_synthetic_upe_batches(
+    n_upe: int = 8,
+    rows_per_upe: tuple[int, int] = (2, 6),
+    seed: int = 42,
+    upes_per_batch: int = 1_000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Gera o conjunto de dados sintético em lotes, sem manter todas as linhas em memória.
+
+    Cada lote cobre até upes_per_batch UPEs e é gerado por make_synthetic_upe_dataset com uma
+    semente derivada de seed. Os DOCUMENTOs de cada lote começam após os do lote anterior e
+    as UPEs de cada lote ocupam uma faixa própria (190000-199998 deslocada de 10000 por lote),
+    de modo que lotes diferentes nunca compartilham UPEs.
+
+    Limitação: dentro de um lote, as UPEs são sorteadas com reposição em uma faixa de 9999
+    valores (como em make_synthetic_upe_dataset). Identificadores repetidos unem janelas
+    planejadas distintas na mesma UPE; a fração repetida cresce com upes_per_batch (cerca de
+    5% das UPEs com o padrão de 1000 e mais de um terço com 10000).
+
+    Args:
+        n_upe (int): Número total de UPEs a serem geradas.
+        rows_per_upe (tuple[int, int]): Faixa de linhas por UPE.
+        seed (int): Semente aleatória para reprodutibilidade.
+        upes_per_batch (int): Número máximo de UPEs por lote.
+
+    Yields:
+        pd.DataFrame: Lote com as mesmas colunas de make_synthetic_upe_dataset.
+    """
+    n_batches = -(-n_upe // upes_per_batch)
+    child_seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    next_document = 400000
+
+    for batch, child_seed in enumerate(child_seeds):
+        batch_upe = min(upes_per_batch, n_upe - batch * upes_per_batch)
+        df = make_synthetic_upe_dataset(
+            n_upe=batch_upe,
+            rows_per_upe=rows_per_upe,
+            seed=int(child_seed.generate_state(1)[0]),
+        )
+        df["DOCUMENTO"] += next_document - 400000
+        df["UPE"] += batch * 10_000
+        if len(df):
+            next_document = int(df["DOCUMENTO"].max()) + 1
+        yield df
@@ -5,7 +5,7 @@ import pytest
 from construct_cost_ai.domain.models import Budget, BudgetItem, BudgetMetadata
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_budget_items():
     """Sample budget items for testing."""
     return [
@@ -42,7 +42,7 @@ def sample_budget_items():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata():
     """Sample budget metadata for testing."""
     return BudgetMetadata(
@@ -54,7 +54,35 @@ def sample_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_budget(sample_budget_items, sample_metadata):
     """Sample complete budget for testing."""
     return Budget(items=sample_budget_items, metadata=sample_metadata)
+
+
+@pytest.fixture(scope="session")
+def sample_budget_request(sample_budget_items, sample_metadata):
+    """Sample budget serialized as a /validate-budget request body."""
+    return {
+        "items": [item.model_dump() for item in sample_budget_items],
+        "metadata": sample_metadata.model_dump(),
+    }
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """FastAPI test client shared by the whole session."""
+    from fastapi.testclient import TestClient
+
+    from construct_cost_ai.api.app import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def mock_ai():
+    """Mock-mode AI client shared by the whole session."""
+    from construct_cost_ai.infra.ai import StackSpotAIClient
+
+    return StackSpotAIClient(mock_mode=True)
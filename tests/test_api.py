@@ -1,15 +1,9 @@
 """Tests for the FastAPI application."""
 
-from fastapi.testclient import TestClient
 
-from construct_cost_ai.api.app import app
-
-client = TestClient(app)
-
-
-def test_health_check():
+def test_health_check(api_client):
     """Test the health check endpoint."""
-    response = client.get("/health")
+    response = api_client.get("/health")
 
     assert response.status_code == 200
     data = response.json()
@@ -17,14 +11,9 @@ def test_health_check():
     assert "version" in data
 
 
-def test_validate_budget_success(sample_budget_items, sample_metadata):
+def test_validate_budget_success(api_client, sample_budget_request):
     """Test successful budget validation."""
-    request_data = {
-        "items": [item.model_dump() for item in sample_budget_items],
-        "metadata": sample_metadata.model_dump(),
-    }
-
-    response = client.post("/validate-budget", json=request_data)
+    response = api_client.post("/validate-budget", json=sample_budget_request)
 
     assert response.status_code == 200
     data = response.json()
@@ -43,7 +32,7 @@ def test_validate_budget_success(sample_budget_items, sample_metadata):
     assert summary["risk_level"] in ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
 
 
-def test_validate_budget_invalid_data():
+def test_validate_budget_invalid_data(api_client):
     """Test validation with invalid budget data."""
     request_data = {
         "items": [],  # Empty items list should fail validation
@@ -54,13 +43,13 @@ def test_validate_budget_invalid_data():
         },
     }
 
-    response = client.post("/validate-budget", json=request_data)
+    response = api_client.post("/validate-budget", json=request_data)
 
     # Should return 422 for validation error
     assert response.status_code == 422
 
 
-def test_validate_budget_missing_fields():
+def test_validate_budget_missing_fields(api_client):
     """Test validation with missing required fields."""
     request_data = {
         "items": [
@@ -77,12 +66,12 @@ def test_validate_budget_missing_fields():
         },
     }
 
-    response = client.post("/validate-budget", json=request_data)
+    response = api_client.post("/validate-budget", json=request_data)
 
     assert response.status_code == 422
 
 
-def test_validate_budget_with_findings():
+def test_validate_budget_with_findings(api_client):
     """Test validation that produces findings."""
     request_data = {
         "items": [
@@ -104,7 +93,7 @@ def test_validate_budget_with_findings():
         },
     }
 
-    response = client.post("/validate-budget", json=request_data)
+    response = api_client.post("/validate-budget", json=request_data)
 
     assert response.status_code == 200
     data = response.json()
@@ -113,7 +102,7 @@ def test_validate_budget_with_findings():
     assert data["summary"]["total_findings"] >= 0
 
 
-def test_validate_budget_response_structure():
+def test_validate_budget_response_structure(api_client):
     """Test that response has correct structure."""
     request_data = {
         "items": [
@@ -135,7 +124,7 @@ def test_validate_budget_response_structure():
         },
     }
 
-    response = client.post("/validate-budget", json=request_data)
+    response = api_client.post("/validate-budget", json=request_data)
 
     assert response.status_code == 200
     data = response.json()
@@ -0,0 +1,127 @@
+"""Tests for the budget reader."""
+
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.readers.budget_reader.budget_reader import (
+    FileInput,
+    append_data,
+    concat_tables,
+    find_metadata_value,
+    read_budget_table,
+)
+
+SAMPLES_DIR = Path(__file__).parents[1] / "data" / "inputs" / "orcamentos"
+
+
+@pytest.mark.parametrize(
+    "file_names",
+    [
+        ["sample_padrao1 - UPE 188292.xlsx"],
+        ["sample_padrao2_fg.xlsx"],
+        ["sample_padrao1 - UPE 188292.xlsx", "sample_padrao2_fg.xlsx"],
+    ],
+)
+def test_concat_tables_result_dtypes(file_names):
+    """Test that the consolidated table has the same dtype per column for any layout mix."""
+    all_tables, all_metadata = [], []
+    for file_name in file_names:
+        file_path = str(SAMPLES_DIR / file_name)
+        table, sheet_name, metadata = read_budget_table(file_path=file_path)
+        append_data(all_tables, all_metadata, FileInput(file_path, sheet_name), table, metadata)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        result = concat_tables(all_tables)
+
+    assert result["PRECO PAGO"].dtype == "float64"
+    assert result["QUANTIDADE"].dtype == "float64"
+    assert result["VALOR TOTAL"].dtype == "float64"
+    assert result["ID"].dtype == pd.StringDtype("pyarrow")
+    assert result["NOME"].dtype == pd.StringDtype("pyarrow")
+    assert result["UNIDADE"].dtype == pd.StringDtype("pyarrow")
+    assert set(result["SOURCE_FILE"]) == set(file_names)
+
+
+def test_read_budget_table_header_on_first_row(tmp_path):
+    """Test that a table whose header is on the first row of the sheet is read."""
+    file_path = tmp_path / "header_first_row.xlsx"
+    rows = [
+        ["ID", "DESCRICAO", "UN.", "UNITARIO", "COMENTARIO", "QUANTIDADE", "TOTAL"],
+        ["1.1", "CONCRETO", "M3", 450.0, None, 10.0, 4500.0],
+        ["1.2", "PISO CERAMICO", "M2", 55.0, None, 50.0, 2750.0],
+    ]
+    pd.DataFrame(rows).to_excel(file_path, sheet_name="LPU", header=False, index=False)
+
+    table, sheet_name, metadata = read_budget_table(file_path=str(file_path))
+
+    assert sheet_name == "LPU"
+    assert isinstance(table, pd.DataFrame)
+    assert table["NOME"].tolist() == ["CONCRETO", "PISO CERAMICO"]
+    assert table["QUANTIDADE"].tolist() == [10.0, 50.0]
+
+
+def test_find_metadata_value_skips_blank_rows():
+    """Test that specific_cell and max_rows_to_iterate count only non-empty rows."""
+    values = np.array(
+        [
+            ["CONSTRUTORA", None],
+            [None, None],
+            ["ACME ENGENHARIA", None],
+            [None, None],
+            ["UPE", None],
+            [None, None],
+            ["188292", None],
+        ],
+        dtype=object,
+    )
+    filled_rows = np.flatnonzero(~pd.isna(values).all(axis=1))
+    metadata = {"CONSTRUTORA": None, "CÓDIGO_UPE": None}
+
+    find_metadata_value(
+        row=None,
+        col_idx=0,
+        metadata_key="CONSTRUTORA",
+        metadata=metadata,
+        values=values,
+        row_idx=0,
+        specific_cell=(1, 0),
+        filled_rows=filled_rows,
+    )
+    find_metadata_value(
+        row=None,
+        col_idx=0,
+        metadata_key="CÓDIGO_UPE",
+        metadata=metadata,
+        values=values,
+        row_idx=4,
+        max_rows_to_iterate=1,
+        expected_type="int",
+        filled_rows=filled_rows,
+    )
+
+    assert metadata == {"CONSTRUTORA": "ACME ENGENHARIA", "CÓDIGO_UPE": "188292"}
+
+
+def test_read_budget_table_metadata_with_blank_rows(tmp_path):
+    """Test that metadata cells are found when the sheet has blank rows above the table."""
+    file_path = tmp_path / "blank_rows.xlsx"
+    rows = [
+        ["CONSTRUTORA", None, None, None, None, None, None],
+        [None, None, None, None, None, None, None],
+        ["ACME ENGENHARIA", None, None, None, None, None, None],
+        [None, None, None, None, None, None, None],
+        ["ID", "DESCRICAO", "UN.", "UNITARIO", "COMENTARIO", "QUANTIDADE", "TOTAL"],
+        [None, None, None, None, None, None, None],
+        ["1.1", "CONCRETO", "M3", 450.0, None, 10.0, 4500.0],
+    ]
+    pd.DataFrame(rows).to_excel(file_path, sheet_name="LPU", header=False, index=False)
+
+    table, _, metadata = read_budget_table(file_path=str(file_path))
+
+    assert metadata["CONSTRUTORA"] == "ACME ENGENHARIA"
+    assert table["NOME"].tolist() == ["CONCRETO"]
@@ -7,19 +7,16 @@ from construct_cost_ai.domain.validators.deterministic import (
     QuantityDeviationValidator,
     UnitPriceThresholdValidator,
 )
-from construct_cost_ai.infra.ai import StackSpotAIClient
 
 
-def test_orchestrator_initialization():
+def test_orchestrator_initialization(mock_ai):
     """Test orchestrator initialization."""
     validators = [
         QuantityDeviationValidator(),
         UnitPriceThresholdValidator(),
     ]
-    ai_client = StackSpotAIClient(mock_mode=True)
-
     orchestrator = BudgetValidationOrchestrator(
-        deterministic_validators=validators, ai_agent=ai_client
+        deterministic_validators=validators, ai_agent=mock_ai
     )
 
     assert len(orchestrator.deterministic_validators) == 2
@@ -55,13 +52,11 @@ def test_orchestrator_validate_with_validators(sample_budget):
     assert len(result.findings_by_item) >= 0
 
 
-def test_orchestrator_validate_with_ai(sample_budget):
+def test_orchestrator_validate_with_ai(sample_budget, mock_ai):
     """Test validation with AI agent."""
     validators = [QuantityDeviationValidator()]
-    ai_client = StackSpotAIClient(mock_mode=True)
-
     orchestrator = BudgetValidationOrchestrator(
-        deterministic_validators=validators, ai_agent=ai_client
+        deterministic_validators=validators, ai_agent=mock_ai
     )
 
     result = orchestrator.validate(sample_budget)
@@ -0,0 +1,95 @@
+"""Tests for the per-UPE document selection by date."""
+
+import pandas as pd
+import pytest
+
+from utils.scripts.get_documents_by_id.modules.datetime_utils import preprocess_datetime_columns
+from utils.scripts.get_documents_by_id.modules.pick_row_by_date import (
+    pick_row,
+    pick_rows_by_group,
+)
+from utils.scripts.get_documents_by_id.modules.synthetic_data import make_synthetic_upe_dataset
+
+DATE_COLUMNS = ["DATA_INCLUSAO_DOC", "DATA_INICIO_REAL", "DATA_FIM_REAL"]
+
+
+@pytest.fixture(scope="module")
+def synthetic_upe_data():
+    """Seeded synthetic UPE dataset with the date columns converted to datetime."""
+    df = make_synthetic_upe_dataset(n_upe=30, rows_per_upe=(1, 7), seed=7)
+    return preprocess_datetime_columns(df, DATE_COLUMNS)
+
+
+def pick_row_per_upe(group, strategy, strict, between_preference):
+    """Reference selection for one UPE with pick_row, as the orchestrator did per UPE.
+
+    In strict mode each strategy is tried on its own, in order, falling through to the next one
+    when it raises; None means no strategy selected a row.
+    """
+    if not strict:
+        return pick_row(group, strategy=strategy, between_preference=between_preference)
+
+    for strat in strategy:
+        try:
+            return pick_row(
+                group, strategy=[strat], strict=True, between_preference=between_preference
+            )
+        except ValueError:
+            continue
+
+    return None
+
+
+@pytest.mark.parametrize("between_preference", ["first", "last"])
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize(
+    "strategy",
+    [["between_else_nearest"], ["between"], ["nearest"], ["last"], ["between", "last"]],
+)
+def test_pick_rows_by_group_matches_pick_row(
+    synthetic_upe_data, strategy, strict, between_preference
+):
+    """Test that the vectorized selection matches pick_row applied to each UPE."""
+    result = pick_rows_by_group(
+        synthetic_upe_data,
+        group_col="UPE",
+        strategy=strategy,
+        strict=strict,
+        between_preference=between_preference,
+    ).set_index("UPE")
+
+    for upe, group in synthetic_upe_data.groupby("UPE"):
+        expected = pick_row_per_upe(group, strategy, strict, between_preference)
+        if expected is None:
+            # No valid row in strict mode: the group is left out of the result
+            assert upe not in result.index
+            continue
+
+        assert result.loc[upe, "DOCUMENTO"] == expected["DOCUMENTO"]
+        assert result.loc[upe, "STRATEGY_USED"] == expected.attrs["strategy_used"]
+
+
+def test_pick_rows_by_group_reports_fallback_strategy():
+    """Test that STRATEGY_USED reports the strategy that actually selected the row."""
+    df = pd.DataFrame(
+        {
+            "UPE": [1, 1, 2],
+            "DOCUMENTO": [10, 11, 20],
+            "DATA_INCLUSAO_DOC": pd.to_datetime(["2024-01-05", "2024-03-01", "2024-05-01"]),
+            "DATA_INICIO_REAL": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-01-01"]),
+            "DATA_FIM_REAL": pd.to_datetime(["2024-01-31", "2024-01-31", "2024-01-31"]),
+        }
+    )
+
+    result = pick_rows_by_group(df, group_col="UPE", strategy=["between"]).set_index("UPE")
+
+    # UPE 1 has a document inside the interval; UPE 2 falls back to the next strategy
+    assert result.loc[1, "STRATEGY_USED"] == "between"
+    assert result.loc[1, "DOCUMENTO"] == 10
+    assert result.loc[2, "STRATEGY_USED"] == "nearest"
+    assert result.loc[2, "DOCUMENTO"] == 20
+
+    # In strict mode only the requested strategy is applied
+    strict_result = pick_rows_by_group(df, group_col="UPE", strategy=["between"], strict=True)
+    assert strict_result["UPE"].tolist() == [1]
+    assert strict_result["STRATEGY_USED"].tolist() == ["between"]
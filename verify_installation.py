@@ -1,5 +1,6 @@
 """Installation verification script for Construct Cost AI."""
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -18,7 +19,10 @@ def check_python_version():
 
 
 def check_imports():
-    """Check that all required packages can be imported."""
+    """Check that all required packages are installed.
+
+    Uses find_spec so presence is detected without running each package's import.
+    """
     packages = [
         ("fastapi", "FastAPI"),
         ("pydantic", "Pydantic"),
@@ -33,10 +37,9 @@ def check_imports():
 
     all_ok = True
     for module, name in packages:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✓ {name} installed")
-        except ImportError:
+        else:
             print(f"✗ {name} NOT installed")
             all_ok = False
 